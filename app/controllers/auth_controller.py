@@ -1,11 +1,17 @@
 """
 Authentication endpoints (JWT-based) - MVC2 Pattern
 """
+import time
 import uuid
 from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import raiseload
 from sqlmodel import Session, select
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.auth import get_current_user
 from app.core.security import (
@@ -13,14 +19,18 @@ from app.core.security import (
     verify_password,
     create_access_token,
     create_refresh_token,
+    verify_dummy_password,
     decode_token,
+    cache_key_hex,
     generate_invite_token,
     encrypt_str,
 )
 from app.models import User, Organization, OrgMember, OrgDbConnection, OrgAllowedSchema
+from app.utils.cache import TTLCache
 
 # DTOs (Schemas)
 from app.schemas import (
+    AuthedUser,
     RegisterRequest,
     RegisterResponse,
     LoginRequest,
@@ -33,9 +43,12 @@ from app.schemas import (
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
+# Refresh tokens já validados (cache_key_hex(token) → payload)
+_REFRESH_CACHE = TTLCache(maxsize=settings.AUTH_CACHE_MAX_SIZE, ttl=settings.REFRESH_CACHE_TTL)
+
 
 @router.post("/register", response_model=RegisterResponse)
-def register(p: RegisterRequest, db: Session = Depends(get_db)):
+async def register(p: RegisterRequest, db: Session = Depends(get_db)):
     """
     Registro de novo admin + criação de organização.
 
@@ -45,21 +58,23 @@ def register(p: RegisterRequest, db: Session = Depends(get_db)):
     3. Admin é vinculado à org com role='org_admin'
     4. Retorna tokens JWT para acesso imediato
     """
-    # Verificar se email já existe
-    existing_user = db.exec(
-        select(User).where(User.email == p.email)
-    ).first()
-    if existing_user:
+    # Verificar se email e organização já existem (uma única ida ao banco)
+    # I/O do banco e bcrypt rodam no threadpool para não bloquear o event loop
+    email_taken, org_taken = await run_in_threadpool(
+        lambda: db.exec(
+            select(
+                select(User.id).where(User.email == p.email).exists(),
+                select(Organization.id).where(Organization.name == p.org_name).exists(),
+            )
+        ).one()
+    )
+    if email_taken:
         raise HTTPException(
             status_code=400,
             detail="Email já cadastrado. Use /auth/login para entrar."
         )
 
-    # Verificar se organização já existe
-    existing_org = db.exec(
-        select(Organization).where(Organization.name == p.org_name)
-    ).first()
-    if existing_org:
+    if org_taken:
         raise HTTPException(
             status_code=400,
             detail=f"Organização '{p.org_name}' já existe. Escolha outro nome."
@@ -67,7 +82,7 @@ def register(p: RegisterRequest, db: Session = Depends(get_db)):
 
     # Criar usuário (admin)
     user_id = str(uuid.uuid4())
-    hashed_pw = hash_password(p.password)
+    hashed_pw = await run_in_threadpool(hash_password, p.password)
 
     user = User(
         id=user_id,
@@ -77,7 +92,6 @@ def register(p: RegisterRequest, db: Session = Depends(get_db)):
         status="active",
         password_changed_at=datetime.utcnow()
     )
-    db.add(user)
 
     # Criar organização
     org_id = str(uuid.uuid4())
@@ -86,7 +100,6 @@ def register(p: RegisterRequest, db: Session = Depends(get_db)):
         name=p.org_name,
         status="active"
     )
-    db.add(org)
 
     # Criar conexão de banco de dados
     db_connection = OrgDbConnection(
@@ -99,15 +112,6 @@ def register(p: RegisterRequest, db: Session = Depends(get_db)):
         database_name=p.db_name,
         options_json={}
     )
-    db.add(db_connection)
-
-    # Criar schemas permitidos
-    for schema_name in p.allowed_schemas:
-        allowed_schema = OrgAllowedSchema(
-            org_id=org_id,
-            schema_name=schema_name
-        )
-        db.add(allowed_schema)
 
     # Vincular user como admin da organização
     org_member = OrgMember(
@@ -115,11 +119,31 @@ def register(p: RegisterRequest, db: Session = Depends(get_db)):
         org_id=org_id,
         role_in_org="admin"
     )
-    db.add(org_member)
 
-    db.commit()
-    db.refresh(user)
-    db.refresh(org)
+    def persist():
+        # Persistir tudo em um único flush
+        db.add_all([user, org, db_connection, org_member])
+        db.flush()
+
+        # Criar schemas permitidos (um único INSERT multi-row via Core, sem objetos ORM);
+        # nomes repetidos no payload são removidos antes para não violar a PK
+        if p.allowed_schemas:
+            db.execute(
+                insert(OrgAllowedSchema),
+                [{"org_id": org_id, "schema_name": s} for s in dict.fromkeys(p.allowed_schemas)]
+            )
+
+        db.commit()
+
+    try:
+        await run_in_threadpool(persist)
+    except IntegrityError:
+        # Registro concorrente passou pelo pré-check: o índice UNIQUE decide
+        await run_in_threadpool(db.rollback)
+        raise HTTPException(
+            status_code=400,
+            detail="Email ou organização já cadastrados."
+        )
 
     # Gerar tokens JWT
     access_token = create_access_token(data={"sub": user_id})
@@ -127,9 +151,9 @@ def register(p: RegisterRequest, db: Session = Depends(get_db)):
 
     return RegisterResponse(
         user_id=user_id,
-        email=user.email,
+        email=p.email,
         org_id=org_id,
-        org_name=org.name,
+        org_name=p.org_name,
         access_token=access_token,
         refresh_token=refresh_token,
         token_type="bearer"
@@ -137,17 +161,17 @@ def register(p: RegisterRequest, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=LoginResponse)
-def login(p: LoginRequest, db: Session = Depends(get_db)):
+async def login(p: LoginRequest, db: Session = Depends(get_db)):
     """
     Login com email + senha.
 
     Retorna tokens JWT (access + refresh) se credenciais estiverem corretas.
     """
     # Buscar usuário por email
-    user = db.exec(
-        select(User).where(User.email == p.email)
-    ).first()
+    user = await run_in_threadpool(User.get_by_email, db, p.email)
     if not user:
+        # Mesmo custo de bcrypt de um usuário real: o tempo não revela se o email existe
+        await run_in_threadpool(verify_dummy_password, p.password)
         raise HTTPException(
             status_code=401,
             detail="Email ou senha incorretos"
@@ -161,7 +185,7 @@ def login(p: LoginRequest, db: Session = Depends(get_db)):
         )
 
     # Verificar senha
-    if not verify_password(p.password, user.password_hash):
+    if not await run_in_threadpool(verify_password, p.password, user.password_hash):
         raise HTTPException(
             status_code=401,
             detail="Email ou senha incorretos"
@@ -194,7 +218,7 @@ def login(p: LoginRequest, db: Session = Depends(get_db)):
 
 
 @router.post("/accept-invite", response_model=AcceptInviteResponse)
-def accept_invite(p: AcceptInviteRequest, db: Session = Depends(get_db)):
+async def accept_invite(p: AcceptInviteRequest, db: Session = Depends(get_db)):
     """
     Aceitar convite de membro.
 
@@ -205,9 +229,13 @@ def accept_invite(p: AcceptInviteRequest, db: Session = Depends(get_db)):
     4. Membro é ativado e pode fazer login
     """
     # Buscar usuário pelo invite_token
-    user = db.exec(
-        select(User).where(User.invite_token == p.invite_token)
-    ).first()
+    user = await run_in_threadpool(
+        lambda: db.exec(
+            select(User)
+            .options(raiseload("*"))
+            .where(User.invite_token == p.invite_token)
+        ).first()
+    )
     if not user:
         raise HTTPException(
             status_code=404,
@@ -229,34 +257,38 @@ def accept_invite(p: AcceptInviteRequest, db: Session = Depends(get_db)):
         )
 
     # Ativar usuário
-    user.password_hash = hash_password(p.password)
+    user_id, email = user.id, user.email
+    user.password_hash = await run_in_threadpool(hash_password, p.password)
     user.status = "active"
     user.invite_token = None  # Invalidar token
     user.invite_expires = None
     user.password_changed_at = datetime.utcnow()
 
-    db.commit()
-    db.refresh(user)
+    def activate():
+        db.commit()
+
+        # Buscar organização do usuário (vínculo + org em um único JOIN)
+        return db.exec(
+            select(Organization)
+            .options(raiseload("*"))
+            .join(OrgMember, OrgMember.org_id == Organization.id)
+            .where(OrgMember.user_id == user_id)
+        ).first()
 
-    # Buscar organização do usuário
-    org_link = db.exec(
-        select(OrgMember).where(OrgMember.user_id == user.id)
-    ).first()
-    if not org_link:
+    org = await run_in_threadpool(activate)
+    if not org:
         raise HTTPException(
             status_code=500,
             detail="Erro: usuário sem organização vinculada"
         )
 
-    org = db.get(Organization, org_link.org_id)
-
     # Gerar tokens JWT
-    access_token = create_access_token(data={"sub": user.id})
-    refresh_token = create_refresh_token(data={"sub": user.id})
+    access_token = create_access_token(data={"sub": user_id})
+    refresh_token = create_refresh_token(data={"sub": user_id})
 
     return AcceptInviteResponse(
-        user_id=user.id,
-        email=user.email,
+        user_id=user_id,
+        email=email,
         org_id=org.id,
         org_name=org.name,
         access_token=access_token,
@@ -266,7 +298,7 @@ def accept_invite(p: AcceptInviteRequest, db: Session = Depends(get_db)):
 
 
 @router.post("/refresh", response_model=RefreshTokenResponse)
-def refresh_access_token(p: RefreshTokenRequest):
+async def refresh_access_token(p: RefreshTokenRequest):
     """
     Renovar access token usando refresh token.
 
@@ -274,9 +306,18 @@ def refresh_access_token(p: RefreshTokenRequest):
     1. Cliente envia refresh_token
     2. Sistema valida e gera novo access_token
     3. Refresh token continua válido
+
+    HS256 é barato e não há I/O: roda direto no event loop (sem ida ao
+    threadpool), com o payload memoizado até o exp do token.
     """
     # Decodificar refresh token
-    payload = decode_token(p.refresh_token)
+    cache_key = cache_key_hex(p.refresh_token)
+    payload = _REFRESH_CACHE.get(cache_key)
+    if payload is None:
+        payload = decode_token(p.refresh_token)
+        ttl = min(settings.REFRESH_CACHE_TTL, payload.get("exp", 0) - time.time())
+        if ttl > 0:
+            _REFRESH_CACHE.set(cache_key, payload, ttl=ttl)
 
     # Verificar tipo do token
     if payload.get("type") != "refresh":
@@ -303,27 +344,18 @@ def refresh_access_token(p: RefreshTokenRequest):
 
 
 @router.get("/debug/me")
-async def debug_current_user(
-    u=Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
+async def debug_current_user(u: AuthedUser = Depends(get_current_user)):
     """
     DEBUG: Ver informações do usuário autenticado e sua organização.
     Útil para verificar se o JWT tem org_id populado.
-    """
-    from app.core.auth import get_current_user
-    from app.models import OrgMember
-
-    # Buscar OrgMember
-    org_link = db.exec(
-        select(OrgMember).where(OrgMember.user_id == u.id)
-    ).first()
 
+    O vínculo OrgMember já vem resolvido por get_current_user (sem nova consulta).
+    """
     return {
         "user_id": u.id,
         "email": u.email,
         "org_id_in_token": u.org_id,
-        "org_member_exists": bool(org_link),
-        "org_member_org_id": org_link.org_id if org_link else None,
-        "org_member_role": org_link.role_in_org if org_link else None
+        "org_member_exists": u.org_id is not None,
+        "org_member_org_id": u.org_id,
+        "org_member_role": u.role_in_org
     }
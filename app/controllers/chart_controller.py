@@ -11,7 +11,7 @@ from app.schemas import (
     RegenerateChartRequest,
     ChartConfigResponse,
 )
-from app.services.chart_service import ChartService
+from app.services.chart_service import ChartService, get_chart_service
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +21,8 @@ router = APIRouter(tags=["Charts"])
 @router.post("/generate-chart", response_model=ChartConfigResponse)
 async def generate_chart(
     req: GenerateChartRequest,
-    u: AuthedUser = Depends(get_current_user)
+    u: AuthedUser = Depends(get_current_user),
+    chart_service: ChartService = Depends(get_chart_service)
 ):
     """
     Generate chart configuration from query results using LLM
@@ -38,9 +39,7 @@ async def generate_chart(
 
     Returns chart configuration with D3.js spec.
     """
-    chart_service = ChartService()
-
-    config = chart_service.generate_chart_config(
+    config = await chart_service.agenerate_chart_config(
         columns=req.columns,
         data=req.data,
         question=req.question,
@@ -53,7 +52,8 @@ async def generate_chart(
 @router.post("/regenerate-chart", response_model=ChartConfigResponse)
 async def regenerate_chart(
     req: RegenerateChartRequest,
-    u: AuthedUser = Depends(get_current_user)
+    u: AuthedUser = Depends(get_current_user),
+    chart_service: ChartService = Depends(get_chart_service)
 ):
     """
     Regenerate chart based on natural language edit instruction
@@ -74,9 +74,7 @@ async def regenerate_chart(
 
     Returns updated chart configuration.
     """
-    chart_service = ChartService()
-
-    updated_config = chart_service.regenerate_chart(
+    updated_config = await chart_service.aregenerate_chart(
         current_config=req.current_config,
         columns=req.columns,
         data=req.data,
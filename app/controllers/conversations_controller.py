@@ -1,12 +1,14 @@
 """
 Conversations Controller - Manage persistent conversations
 """
+import asyncio
 import logging
-from typing import List
+from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlmodel import Session, select
 
-from app.core.database import get_db
+from app.core.database import get_db, SessionLocal
 from app.core.auth import get_current_user, get_user_org_id
 from app.schemas import (
     AuthedUser,
@@ -19,13 +21,15 @@ from app.schemas import (
     AskInConversationRequest,
     AddMessageRequest,
 )
+from app.repositories.conversation_repository import (
+    DEFAULT_CONVERSATION_TITLE,
+    encode_conversation_cursor,
+)
 from app.repositories import (
     OrgRepository,
     ConversationRepository,
-    ClarificationRepository,
-    AuditRepository,
 )
-from app.services import QueryService, EnrichmentService
+from app.services import QueryService, get_query_service
 from app.models import ConversationMessage
 
 logger = logging.getLogger(__name__)
@@ -33,8 +37,14 @@ logger = logging.getLogger(__name__)
 router = APIRouter(tags=["Conversations"])
 
 
+def _load_org_context(org_id: str):
+    """Org context on its own Session, so it can run concurrently with request-Session queries"""
+    with SessionLocal() as session:
+        return OrgRepository(session).get_org_context_cached(org_id)
+
+
 @router.post("/conversations", response_model=ConversationResponse)
-async def create_conversation(
+def create_conversation(
     req: CreateConversationRequest,
     u: AuthedUser = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -50,7 +60,7 @@ async def create_conversation(
     conv_repo = ConversationRepository(db)
 
     # Create conversation with default title (will be updated on first message)
-    title = req.title or "Nova Conversa"
+    title = req.title or DEFAULT_CONVERSATION_TITLE
 
     conversation = conv_repo.create_conversation(
         org_id=org_id,
@@ -67,51 +77,60 @@ async def create_conversation(
 
 
 @router.get("/conversations", response_model=ListConversationsResponse)
-async def list_conversations(
+def list_conversations(
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
     u: AuthedUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     List user's conversations
 
-    Returns conversations ordered by updated_at (most recent first)
+    Returns conversations ordered by updated_at (most recent first).
+    Paginate with `cursor` (from `next_cursor`); `offset` is deprecated.
     """
     org_id = get_user_org_id(u)
     user_id = u.id
 
     conv_repo = ConversationRepository(db)
 
-    conversations = conv_repo.list_conversations(
+    conversations, total = conv_repo.list_conversations(
         user_id=user_id,
         org_id=org_id,
         limit=limit,
-        offset=offset
+        offset=offset,
+        cursor=cursor
     )
 
-    # Count messages for each conversation
-    response_conversations = []
-    for conv in conversations:
-        messages = conv_repo.get_messages(conv.id)
-        response_conversations.append(
-            ConversationResponse(
-                id=conv.id,
-                title=conv.title,
-                created_at=conv.created_at,
-                updated_at=conv.updated_at,
-                message_count=len(messages)
-            )
+    # Contagem de mensagens em uma única query agregada (sem N+1)
+    counts = conv_repo.count_messages_by_ids([conv.id for conv in conversations])
+
+    response_conversations = [
+        ConversationResponse(
+            id=conv.id,
+            title=conv.title,
+            created_at=conv.created_at,
+            updated_at=conv.updated_at,
+            message_count=counts.get(conv.id, 0)
         )
+        for conv in conversations
+    ]
+
+    next_cursor = (
+        encode_conversation_cursor(conversations[-1])
+        if len(conversations) == limit else None
+    )
 
     return ListConversationsResponse(
         conversations=response_conversations,
-        total=len(conversations)
+        total=total,
+        next_cursor=next_cursor
     )
 
 
 @router.get("/conversations/{conversation_id}", response_model=ConversationHistoryResponse)
-async def get_conversation_history(
+def get_conversation_history(
     conversation_id: str,
     u: AuthedUser = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -123,11 +142,9 @@ async def get_conversation_history(
 
     conv_repo = ConversationRepository(db)
 
-    # This validates user owns conversation
-    conversation = conv_repo.get_conversation(conversation_id, user_id)
-
-    # Get messages
-    messages = conv_repo.get_messages(conversation_id)
+    # This validates user owns conversation (mensagens já carregadas junto)
+    conversation = conv_repo.get_conversation(conversation_id, user_id, load_messages=True)
+    messages = conversation.messages
 
     message_responses = [
         MessageResponse(
@@ -162,7 +179,8 @@ async def ask_in_conversation(
     conversation_id: str,
     req: AskInConversationRequest,
     u: AuthedUser = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    query_service: QueryService = Depends(get_query_service)
 ):
     """
     Ask a question within an existing conversation
@@ -173,13 +191,12 @@ async def ask_in_conversation(
     org_id = get_user_org_id(u)
     user_id = u.id
 
-    # Validate conversation exists and user owns it
+    # Validate conversation ownership and load org context concurrently (independent queries)
     conv_repo = ConversationRepository(db)
-    conversation = conv_repo.get_conversation(conversation_id, user_id)
-
-    # Load organization context
-    org_repo = OrgRepository(db)
-    org_ctx = org_repo.get_org_context(org_id)
+    _, org_ctx = await asyncio.gather(
+        run_in_threadpool(conv_repo.get_conversation, conversation_id, user_id),
+        run_in_threadpool(_load_org_context, org_id),
+    )
 
     # Build query execution context
     from app.dtos import QueryExecutionContext
@@ -189,47 +206,27 @@ async def ask_in_conversation(
         enrich=req.enrich
     )
 
-    # Initialize services
-    clarification_repo = ClarificationRepository(db)
-    audit_repo = AuditRepository(db)
-    enrichment_service = EnrichmentService()
-
-    from app.repositories.query_history_repository import QueryHistoryRepository
-    query_history_repo = QueryHistoryRepository(db)
-
-    query_service = QueryService(
-        clarification_repo=clarification_repo,
-        audit_repo=audit_repo,
-        enrichment_service=enrichment_service,
-        conversation_repo=conv_repo,
-        query_history_repo=query_history_repo
-    )
-
     # Execute query with conversation context
-    result = query_service.execute_query(
+    # Sync pipeline (LLM + DB): runs on the threadpool instead of blocking the event loop
+    result = await run_in_threadpool(
+        query_service.execute_query,
         ctx=ctx,
         org_ctx=org_ctx,
         user_id=user_id,
         conversation_id=conversation_id
     )
 
-    # Update conversation title if it's the first question
-    messages = conv_repo.get_messages(conversation_id)
-    if len(messages) <= 2:  # user + assistant message
-        # Generate title from first question
-        title = req.pergunta[:100]
-        if len(req.pergunta) > 100:
-            title += "..."
-
-        conversation.title = title
-        db.add(conversation)
-        db.commit()
+    # Título gerado a partir da primeira pergunta (UPDATE só afeta o título padrão)
+    title = req.pergunta[:100]
+    if len(req.pergunta) > 100:
+        title += "..."
+    await run_in_threadpool(conv_repo.update_title_if_unset, conversation_id, title)
 
     return result
 
 
 @router.post("/conversations/{conversation_id}/messages", response_model=MessageResponse)
-async def add_message_to_conversation(
+def add_message_to_conversation(
     conversation_id: str,
     req: AddMessageRequest,
     u: AuthedUser = Depends(get_current_user),
@@ -275,7 +272,7 @@ async def add_message_to_conversation(
 
 
 @router.delete("/conversations/{conversation_id}")
-async def delete_conversation(
+def delete_conversation(
     conversation_id: str,
     u: AuthedUser = Depends(get_current_user),
     db: Session = Depends(get_db)
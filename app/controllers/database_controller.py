@@ -3,6 +3,7 @@ Controller para operações de descoberta e teste de conexões com banco de dado
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from app.schemas.database_schema import (
     TestConnectionRequest,
     TestConnectionResponse,
@@ -49,7 +50,8 @@ async def test_connection(req: TestConnectionRequest):
     """
     logger.info(f"[test-connection] Testando conexão para {req.username}@{req.host}:{req.port}")
 
-    result = DatabaseService.test_connection(
+    result = await run_in_threadpool(
+        DatabaseService.test_connection,
         host=req.host,
         port=req.port,
         username=req.username,
@@ -92,7 +94,8 @@ async def list_databases(req: ListDatabasesRequest):
     """
     logger.info(f"[list-databases] Listando databases para {req.username}@{req.host}:{req.port}")
 
-    databases = DatabaseService.list_databases(
+    databases = await run_in_threadpool(
+        DatabaseService.list_databases,
         host=req.host,
         port=req.port,
         username=req.username,
@@ -137,7 +140,8 @@ async def list_schemas(req: ListSchemasRequest):
     """
     logger.info(f"[list-schemas] Listando schemas do database '{req.database_name}'")
 
-    schemas = DatabaseService.list_schemas(
+    schemas = await run_in_threadpool(
+        DatabaseService.list_schemas,
         host=req.host,
         port=req.port,
         username=req.username,
@@ -185,7 +189,8 @@ async def get_table_info(req: TableInfoRequest):
     """
     logger.info(f"[table-info] Obtendo info da tabela '{req.table_name}' no database '{req.database_name}'")
 
-    info = DatabaseService.get_table_info(
+    info = await run_in_threadpool(
+        DatabaseService.get_table_info,
         host=req.host,
         port=req.port,
         username=req.username,
@@ -3,11 +3,13 @@ Document management endpoints - MVC2 Pattern
 CONTROLLER = Coordena Model e View
 """
 from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form
+from fastapi.concurrency import run_in_threadpool
 from sqlmodel import Session, select
 
 from app.core.database import get_db
 from app.core.auth import get_current_user, get_user_org_id
 from app.models import Organization, BizDocument
+from app.repositories import invalidate_org_context_cache
 from app.utils.documents import extract_text_from_upload, summarize_business_metadata
 from app.schemas import AuthedUser
 
@@ -15,7 +17,7 @@ router = APIRouter(prefix="/documents", tags=["Documents"])
 
 
 @router.post("", response_model=dict)
-async def create_document(
+def create_document(
     titulo: str,
     conteudo: str,
     tipo: str = "data_dictionary",
@@ -48,12 +50,13 @@ async def create_document(
             "type": tipo
         }
     )
+    invalidate_org_context_cache(org_id)
 
     return {"ok": True, "doc_id": doc.id, "org_id": org_id}
 
 
 @router.get("", response_model=dict)
-async def list_documents(
+def list_documents(
     u: AuthedUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -67,18 +70,38 @@ async def list_documents(
     if not org:
         raise HTTPException(status_code=404, detail="org não encontrada.")
 
-    # CONTROLLER chama MODEL diretamente
-    docs = BizDocument.list_by_org(db=db, org_id=org_id)
+    # CONTROLLER chama MODEL diretamente (projeção leve; metadata_json completo em GET /documents/{doc_id})
+    docs = BizDocument.list_by_org_light(db=db, org_id=org_id)
 
     return {
         "org_id": org_id,
         "documents": [
-            {"id": d.id, "title": d.title, "metadata_json": d.metadata_json}
-            for d in docs
+            {"id": doc_id, "title": title, "type": doc_type, "preview": preview}
+            for doc_id, title, doc_type, preview in docs
         ]
     }
 
 
+@router.get("/{doc_id}", response_model=dict)
+def get_document(
+    doc_id: int,
+    u: AuthedUser = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    CONTROLLER: Get a single document with its full metadata
+    """
+    # Get user's org_id
+    org_id = get_user_org_id(u)
+
+    # CONTROLLER chama MODEL para buscar
+    doc = BizDocument.get_by_id(db=db, doc_id=doc_id)
+    if not doc or doc.org_id != org_id:
+        raise HTTPException(status_code=404, detail="Documento não encontrado")
+
+    return {"id": doc.id, "title": doc.title, "metadata_json": doc.metadata_json}
+
+
 @router.post("/extract", response_model=dict)
 async def extract_document(
     title: str = Form(...),
@@ -92,15 +115,18 @@ async def extract_document(
     # Get user's org_id
     org_id = get_user_org_id(u)
 
-    org = db.get(Organization, org_id)
+    # Blocking DB calls also go through the threadpool (async handler)
+    org = await run_in_threadpool(db.get, Organization, org_id)
     if not org:
         raise HTTPException(status_code=404, detail="org não encontrada.")
 
-    raw_text = extract_text_from_upload(file)
-    meta = summarize_business_metadata(raw_text)
+    # Parsing is CPU-bound and the summary is a blocking LLM call: keep both off the event loop
+    raw_text = await run_in_threadpool(extract_text_from_upload, file)
+    meta = await run_in_threadpool(summarize_business_metadata, raw_text)
 
-    # CONTROLLER chama MODEL diretamente
-    doc = BizDocument.create(
+    # CONTROLLER chama MODEL diretamente (INSERT + commit no threadpool)
+    doc = await run_in_threadpool(
+        BizDocument.create,
         db=db,
         org_id=org_id,
         title=title,
@@ -110,6 +136,7 @@ async def extract_document(
             "meta": meta
         }
     )
+    invalidate_org_context_cache(org_id)
 
     return {
         "ok": True,
@@ -121,7 +148,7 @@ async def extract_document(
 
 
 @router.delete("/{doc_id}", response_model=dict)
-async def delete_document(
+def delete_document(
     doc_id: int,
     u: AuthedUser = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -139,5 +166,6 @@ async def delete_document(
 
     # CONTROLLER chama MODEL para deletar
     doc.delete(db=db)
+    invalidate_org_context_cache(org_id)
 
     return {"ok": True, "deleted_doc_id": doc_id}
@@ -2,13 +2,20 @@
 Member management endpoints (admin only) - MVC2 Pattern
 """
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
 
 from app.core.database import get_db
 from app.core.security import generate_invite_token
-from app.core.auth import get_current_user, get_user_org_id
+from app.core.auth import (
+    get_current_user,
+    get_user_org_id,
+    invalidate_user_cache,
+    load_admin_and_target,
+    require_org_admin,
+)
 from app.models import User, Organization, OrgMember
 from app.schemas import (
     AuthedUser,
@@ -27,7 +34,7 @@ router = APIRouter(prefix="/members", tags=["Members"])
 @router.post("/invite", response_model=InviteMemberResponse)
 def invite_member(
     p: InviteMemberRequest,
-    current_user: AuthedUser = Depends(get_current_user),
+    current_user: AuthedUser = Depends(require_org_admin),
     db: Session = Depends(get_db)
 ):
     """
@@ -44,29 +51,11 @@ def invite_member(
     - Somente admin pode convidar
     - Email não pode já estar cadastrado
     """
-    # Get user's org_id and check if user is admin
+    # Admin da organização já validado pela dependência require_org_admin
     org_id = get_user_org_id(current_user)
 
-    # Verificar se é admin da organização
-    org_member_admin = db.exec(
-        select(OrgMember).where(
-            OrgMember.user_id == current_user.id,
-            OrgMember.org_id == org_id,
-            OrgMember.role_in_org == "admin"
-        )
-    ).first()
-
-    if not org_member_admin:
-        raise HTTPException(
-            status_code=403,
-            detail="Acesso restrito a administradores desta organização"
-        )
-
     # Verificar se email já existe
-    existing_user = db.exec(
-        select(User).where(User.email == p.email)
-    ).first()
-    if existing_user:
+    if User.email_exists(db=db, email=p.email):
         raise HTTPException(
             status_code=400,
             detail=f"Email '{p.email}' já cadastrado no sistema"
@@ -77,17 +66,12 @@ def invite_member(
     if not org:
         raise HTTPException(status_code=404, detail="Organização não encontrada")
 
-    # Validar role_in_org
+    # role_in_org já validado pelo schema (Literal)
     role = p.role_in_org or "member"
-    if role not in ("admin", "member"):
-        raise HTTPException(
-            status_code=400,
-            detail="Role inválida. Use 'admin' ou 'member'"
-        )
 
-    # Gerar invite token
+    # Gerar invite token (UTC aware; o banco guarda DATETIME naive em UTC)
     invite_token = generate_invite_token()
-    invite_expires = datetime.utcnow() + timedelta(days=7)
+    invite_expires = datetime.now(timezone.utc) + timedelta(days=7)
 
     # Criar usuário com status='invited'
     user_id = str(uuid.uuid4())
@@ -97,27 +81,28 @@ def invite_member(
         email=p.email,
         status="invited",
         invite_token=invite_token,
-        invite_expires=invite_expires,
+        invite_expires=invite_expires.replace(tzinfo=None),
         password_hash=None  # Será definido ao aceitar convite
     )
-    db.add(user)
-
-    # CONTROLLER chama MODEL com role especificada
-    org_member = OrgMember.create(
-        db=db,
-        user_id=user_id,
-        org_id=org_id,
-        role_in_org=role
-    )
-
-    db.commit()
-    db.refresh(user)
+    org_member = OrgMember(user_id=user_id, org_id=org_id, role_in_org=role)
+
+    # Usuário + vínculo em um único commit (sem refresh: já temos os valores)
+    db.add_all([user, org_member])
+    try:
+        db.commit()
+    except IntegrityError:
+        # Convite concorrente passou pelo pré-check: o índice UNIQUE decide
+        db.rollback()
+        raise HTTPException(
+            status_code=400,
+            detail=f"Email '{p.email}' já cadastrado no sistema"
+        )
 
     return InviteMemberResponse(
         user_id=user_id,
-        email=user.email,
-        name=user.name,
-        status=user.status,
+        email=p.email,
+        name=p.name,
+        status="invited",
         invite_token=invite_token,
         invite_expires=invite_expires.isoformat(),
         message=f"Membro convidado com sucesso. Envie o token para {p.email}"
@@ -146,22 +131,19 @@ def list_members(
     if not org:
         raise HTTPException(status_code=404, detail="Organização não encontrada")
 
-    # CONTROLLER chama MODEL
-    org_members = OrgMember.list_by_org(db=db, org_id=org_id)
-
-    members_info = []
-    for om in org_members:
-        user = db.get(User, om.user_id)
-        if user:
-            members_info.append(
-                MemberInfo(
-                    user_id=user.id,
-                    name=user.name,
-                    email=user.email,
-                    role_in_org=om.role_in_org,
-                    status=user.status
-                )
-            )
+    # CONTROLLER chama MODEL (membros + usuários em um único JOIN, sem N+1)
+    org_members = OrgMember.list_with_users_by_org(db=db, org_id=org_id)
+
+    members_info = [
+        MemberInfo(
+            user_id=user.id,
+            name=user.name,
+            email=user.email,
+            role_in_org=om.role_in_org,
+            status=user.status
+        )
+        for om, user in org_members
+    ]
 
     return ListMembersResponse(
         org_id=org_id,
@@ -188,50 +170,14 @@ def update_member_role(
     - Somente admin pode atualizar roles
     - Não pode remover o próprio admin se for o último
     """
-    # Get user's org_id and check if user is admin
     org_id = get_user_org_id(current_user)
 
-    # Verificar se é admin da organização
-    org_member_admin = db.exec(
-        select(OrgMember).where(
-            OrgMember.user_id == current_user.id,
-            OrgMember.org_id == org_id,
-            OrgMember.role_in_org == "admin"
-        )
-    ).first()
-
-    if not org_member_admin:
-        raise HTTPException(
-            status_code=403,
-            detail="Acesso restrito a administradores desta organização"
-        )
-
-    # Validar role
-    if p.role_in_org not in ("admin", "member"):
-        raise HTTPException(
-            status_code=400,
-            detail="Role inválida. Use 'admin' ou 'member'"
-        )
-
-    # CONTROLLER chama MODEL
-    org_member = OrgMember.get_member(db=db, user_id=user_id, org_id=org_id)
-
-    if not org_member:
-        raise HTTPException(
-            status_code=404,
-            detail="Membro não encontrado nesta organização"
-        )
+    # Checagem de admin + membro alvo + usuário alvo em uma única query
+    org_member, user = load_admin_and_target(db, org_id, current_user.id, user_id)
 
     # Verificar se está tentando rebaixar o último admin
     if org_member.role_in_org == "admin" and p.role_in_org == "member":
-        admin_count = db.exec(
-            select(OrgMember).where(
-                OrgMember.org_id == org_id,
-                OrgMember.role_in_org == "admin"
-            )
-        ).all()
-
-        if len(admin_count) == 1:
+        if OrgMember.count_admins(db=db, org_id=org_id) == 1:
             raise HTTPException(
                 status_code=400,
                 detail="Não é possível rebaixar o último administrador da organização"
@@ -239,8 +185,7 @@ def update_member_role(
 
     # CONTROLLER chama MODEL
     org_member.update_role(db=db, role_in_org=p.role_in_org)
-
-    user = db.get(User, user_id)
+    invalidate_user_cache(user_id)
 
     return UpdateMemberRoleResponse(
         user_id=user_id,
@@ -269,52 +214,22 @@ def remove_member(
     - Não pode remover o último admin
     - Não pode remover a si mesmo se for o último admin
     """
-    # Get user's org_id and check if user is admin
     org_id = get_user_org_id(current_user)
 
-    # Verificar se é admin da organização
-    org_member_admin = db.exec(
-        select(OrgMember).where(
-            OrgMember.user_id == current_user.id,
-            OrgMember.org_id == org_id,
-            OrgMember.role_in_org == "admin"
-        )
-    ).first()
-
-    if not org_member_admin:
-        raise HTTPException(
-            status_code=403,
-            detail="Acesso restrito a administradores desta organização"
-        )
-
-    # CONTROLLER chama MODEL
-    org_member = OrgMember.get_member(db=db, user_id=user_id, org_id=org_id)
-
-    if not org_member:
-        raise HTTPException(
-            status_code=404,
-            detail="Membro não encontrado nesta organização"
-        )
+    # Checagem de admin + membro alvo + usuário alvo em uma única query
+    org_member, user = load_admin_and_target(db, org_id, current_user.id, user_id)
 
     # Verificar se está tentando remover o último admin
     if org_member.role_in_org == "admin":
-        admin_count = db.exec(
-            select(OrgMember).where(
-                OrgMember.org_id == org_id,
-                OrgMember.role_in_org == "admin"
-            )
-        ).all()
-
-        if len(admin_count) == 1:
+        if OrgMember.count_admins(db=db, org_id=org_id) == 1:
             raise HTTPException(
                 status_code=400,
                 detail="Não é possível remover o último administrador da organização"
             )
 
-    user = db.get(User, user_id)
-
     # CONTROLLER chama MODEL
     org_member.delete(db=db)
+    invalidate_user_cache(user_id)
 
     return RemoveMemberResponse(
         user_id=user_id,
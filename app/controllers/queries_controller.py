@@ -4,16 +4,18 @@ Natural Language to SQL Query Pipeline - Refactored with Service Layer
 import logging
 import asyncio
 from typing import AsyncGenerator
-from fastapi import APIRouter, Depends
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlmodel import Session
 
 from app.core.database import get_db
+from app.core.responses import encode_query_result
 from app.core.auth import get_current_user, get_user_org_id
 from app.schemas import PerguntaOrg, AuthedUser
 from app.dtos import QueryExecutionContext, StreamEvent
 from app.repositories import OrgRepository, ClarificationRepository, AuditRepository, ConversationRepository
-from app.services import QueryService, EnrichmentService
+from app.services import QueryService, get_enrichment_service
 from app.core.streaming import format_sse
 
 logger = logging.getLogger(__name__)
@@ -24,6 +26,7 @@ router = APIRouter(tags=["Query"])
 @router.post("/perguntar_org")
 async def perguntar_org(
     p: PerguntaOrg,
+    background_tasks: BackgroundTasks,
     u: AuthedUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -39,9 +42,9 @@ async def perguntar_org(
     # 1. Get user's org_id
     org_id = get_user_org_id(u)
 
-    # 2. Load organization context (via repository)
+    # 2. Load organization context (via repository, off the event loop on a miss)
     org_repo = OrgRepository(db)
-    org_ctx = org_repo.get_org_context(org_id)
+    org_ctx = await run_in_threadpool(org_repo.get_org_context_cached, org_id)
 
     # 3. Build query execution context
     ctx = QueryExecutionContext(
@@ -56,30 +59,34 @@ async def perguntar_org(
     # 4. Initialize service layer
     clarification_repo = ClarificationRepository(db)
     audit_repo = AuditRepository(db)
-    enrichment_service = EnrichmentService()
+    enrichment_service = get_enrichment_service()
     conversation_repo = ConversationRepository(db) if p.conversation_id else None
 
     query_service = QueryService(
         clarification_repo=clarification_repo,
         audit_repo=audit_repo,
         enrichment_service=enrichment_service,
-        conversation_repo=conversation_repo
+        conversation_repo=conversation_repo,
+        background_tasks=background_tasks
     )
 
     # 5. Execute query (all business logic in service)
-    result = query_service.execute_query(
+    # Sync pipeline (LLM + DB): runs on the threadpool instead of blocking the event loop
+    result = await run_in_threadpool(
+        query_service.execute_query,
         ctx=ctx,
         org_ctx=org_ctx,
         user_id=u.id,
         conversation_id=p.conversation_id
     )
 
-    return result
+    return JSONResponse(encode_query_result(result))
 
 
 @router.post("/perguntar_org_stream")
 async def perguntar_org_stream(
     p: PerguntaOrg,
+    background_tasks: BackgroundTasks,
     u: AuthedUser = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -95,6 +102,7 @@ async def perguntar_org_stream(
     - generating_sql: Generating SQL query
     - executing_sql: Executing SQL on database
     - enriching: Generating insights (if enrich=true)
+    - insight_token: Insights text chunk as the LLM streams it (in `message`)
     - completed: Query completed successfully
     - error: Error occurred
     - done: Final marker (no data)
@@ -102,9 +110,9 @@ async def perguntar_org_stream(
     # 1. Get user's org_id
     org_id = get_user_org_id(u)
 
-    # 2. Load organization context
+    # 2. Load organization context (via repository, off the event loop on a miss)
     org_repo = OrgRepository(db)
-    org_ctx = org_repo.get_org_context(org_id)
+    org_ctx = await run_in_threadpool(org_repo.get_org_context_cached, org_id)
 
     # 3. Build query execution context
     ctx = QueryExecutionContext(
@@ -119,7 +127,7 @@ async def perguntar_org_stream(
     # 4. Initialize service layer
     clarification_repo = ClarificationRepository(db)
     audit_repo = AuditRepository(db)
-    enrichment_service = EnrichmentService()
+    enrichment_service = get_enrichment_service()
     conversation_repo = ConversationRepository(db) if p.conversation_id else None
 
     from app.repositories.query_history_repository import QueryHistoryRepository
@@ -130,16 +138,18 @@ async def perguntar_org_stream(
         audit_repo=audit_repo,
         enrichment_service=enrichment_service,
         conversation_repo=conversation_repo,
-        query_history_repo=query_history_repo
+        query_history_repo=query_history_repo,
+        background_tasks=background_tasks  # Audit write runs after the stream ends
     )
 
     # 5. Create event queue for streaming
     event_queue: asyncio.Queue[StreamEvent | None] = asyncio.Queue()
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
 
     def emit_event(event: StreamEvent):
         """Callback to emit events from sync code running in thread"""
-        logger.info(f"[SSE Emit] stage={event.stage}, progress={event.progress}, message={event.message}")
+        if event.stage != "insight_token":  # one per streamed token: too noisy to log
+            logger.info(f"[SSE Emit] stage={event.stage}, progress={event.progress}, message={event.message}")
         # Use call_soon_threadsafe since this is called from executor thread
         loop.call_soon_threadsafe(event_queue.put_nowait, event)
 
@@ -161,18 +171,18 @@ async def perguntar_org_stream(
                             conversation_id=p.conversation_id
                         )
                     )
-                    # Signal completion with None
-                    await event_queue.put(None)
+                    # Signal completion with None (unbounded queue: never blocks)
+                    event_queue.put_nowait(None)
                     # Store result for final event
                     return result
                 except Exception as e:
                     logger.error(f"Query execution error: {e}", exc_info=True)
-                    await event_queue.put(StreamEvent(
+                    event_queue.put_nowait(StreamEvent(
                         stage="error",
                         progress=0,
                         error=str(e)
                     ))
-                    await event_queue.put(None)
+                    event_queue.put_nowait(None)
 
             # Start execution task
             execution_task = asyncio.create_task(execute_in_thread())
@@ -1,19 +1,35 @@
 """
 Core dependencies - Authentication and authorization
 """
-from typing import Optional
+import time
+from typing import Optional, Tuple
 from fastapi import HTTPException, Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.orm import raiseload
 from sqlmodel import Session, select
 
+from app.core.config import settings
 from app.core.database import get_db
-from app.core.security import decode_token, sha256_hex
+from app.core.security import decode_token, cache_key_hex
 from app.models import User, OrgMember
 from app.schemas import AuthedUser
+from app.utils.cache import TTLCache
 
 # JWT Security
 security = HTTPBearer()
 
+# Resolved tokens (cache_key_hex(token) → AuthedUser), skips JWT decode + user/org lookups on hot paths
+_AUTH_CACHE = TTLCache(maxsize=settings.AUTH_CACHE_MAX_SIZE, ttl=settings.AUTH_CACHE_TTL)
+
+
+def invalidate_user_cache(user_id: str) -> None:
+    """
+    Drop cached authentication results for a user.
+    Call after changes that affect AuthedUser (membership, role, status).
+    """
+    _AUTH_CACHE.pop_where(lambda _key, authed: authed.id == user_id)
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -23,6 +39,10 @@ async def get_current_user(
     JWT-based authentication dependency.
     Extracts user from JWT token in Authorization header.
 
+    Results are cached per token for AUTH_CACHE_TTL seconds (never past
+    the token's own exp), so status changes may take up to that long to
+    be enforced.
+
     Usage:
         @router.get("/protected")
         def protected_route(user: AuthedUser = Depends(get_current_user)):
@@ -30,6 +50,11 @@ async def get_current_user(
     """
     token = credentials.credentials
 
+    cache_key = cache_key_hex(token)
+    cached = _AUTH_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     # Decode and validate JWT token
     payload = decode_token(token)
 
@@ -42,17 +67,25 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"}
         )
 
-    # Load user from database
-    user = db.exec(
-        select(User).where(User.id == user_id)
-    ).first()
-    if not user:
+    # Load user + first org membership in one round trip, off the event loop
+    row = await run_in_threadpool(
+        lambda: db.exec(
+            select(User, OrgMember.org_id, OrgMember.role_in_org)
+            .options(raiseload("*"))
+            .outerjoin(OrgMember, OrgMember.user_id == User.id)
+            .where(User.id == user_id)
+            .limit(1)
+        ).first()
+    )
+    if not row:
         raise HTTPException(
             status_code=401,
             detail="Usuário não encontrado",
             headers={"WWW-Authenticate": "Bearer"}
         )
 
+    user, org_id, role_in_org = row
+
     # Check if user is active
     if user.status != "active":
         raise HTTPException(
@@ -62,16 +95,23 @@ async def get_current_user(
         )
 
     # Return authenticated user info with org_id from first org membership
-    org_link = db.exec(
-        select(OrgMember).where(OrgMember.user_id == user.id)
-    ).first()
-
-    return AuthedUser(
+    authed = AuthedUser(
         id=user.id,
         email=user.email,
-        org_id=org_link.org_id if org_link else None
+        org_id=org_id,
+        role_in_org=role_in_org
     )
 
+    # An expired token must not outlive its exp through the cache
+    ttl = settings.AUTH_CACHE_TTL
+    exp = payload.get("exp")
+    if exp is not None:
+        ttl = min(ttl, exp - time.time())
+    if ttl > 0:
+        _AUTH_CACHE.set(cache_key, authed, ttl=ttl)
+
+    return authed
+
 
 async def require_org_admin(
     current_user: AuthedUser = Depends(get_current_user),
@@ -79,25 +119,23 @@ async def require_org_admin(
 ) -> AuthedUser:
     """
     Dependency to require organization admin role.
-    User must have role_in_org='admin' in at least one organization.
+    User must have role_in_org='admin' in their current organization.
 
     Usage:
         @router.post("/members/invite")
         def invite_member(admin: AuthedUser = Depends(require_org_admin)):
             ...
     """
-    # Check if user is admin in any organization
-    admin_link = db.exec(
-        select(OrgMember).where(
-            OrgMember.user_id == current_user.id,
-            OrgMember.role_in_org == "admin"
-        )
-    ).first()
+    org_id = get_user_org_id(current_user)
 
-    if not admin_link:
+    # Check if user is admin of their organization
+    is_admin = await run_in_threadpool(
+        OrgMember.is_admin, db=db, user_id=current_user.id, org_id=org_id
+    )
+    if not is_admin:
         raise HTTPException(
             status_code=403,
-            detail="Acesso restrito a administradores da organização"
+            detail="Acesso restrito a administradores desta organização"
         )
 
     return current_user
@@ -114,7 +152,7 @@ def require_org_access(org_id: str, user: AuthedUser, db: Session) -> OrgMember:
             # Now you have access to member.role_in_org
     """
     link = db.exec(
-        select(OrgMember).where(
+        select(OrgMember).options(raiseload("*")).where(
             OrgMember.user_id == user.id,
             OrgMember.org_id == org_id
         )
@@ -138,7 +176,7 @@ def require_org_admin_access(org_id: str, user: AuthedUser, db: Session) -> OrgM
             # User is confirmed admin
     """
     link = db.exec(
-        select(OrgMember).where(
+        select(OrgMember).options(raiseload("*")).where(
             OrgMember.user_id == user.id,
             OrgMember.org_id == org_id,
             OrgMember.role_in_org == "admin"
@@ -154,6 +192,48 @@ def require_org_admin_access(org_id: str, user: AuthedUser, db: Session) -> OrgM
     return link
 
 
+def load_admin_and_target(
+    db: Session, org_id: str, caller_id: str, target_id: str
+) -> Tuple[OrgMember, User]:
+    """
+    Check caller is admin of org_id and load the target member + user in one query.
+
+    Raises:
+        HTTPException 403 if caller is not an admin of the org,
+        404 if target is not a member of the org
+
+    Usage:
+        def my_route(user_id: str, user: AuthedUser = Depends(get_current_user), db: Session = Depends(get_db)):
+            target_member, target_user = load_admin_and_target(db, org_id, user.id, user_id)
+    """
+    rows = db.exec(
+        select(OrgMember, User)
+        .join(User, User.id == OrgMember.user_id)
+        .options(raiseload("*"))
+        .where(
+            OrgMember.org_id == org_id,
+            OrgMember.user_id.in_({caller_id, target_id})
+        )
+    ).all()
+    by_user = {om.user_id: (om, user) for om, user in rows}
+
+    caller = by_user.get(caller_id)
+    if caller is None or caller[0].role_in_org != "admin":
+        raise HTTPException(
+            status_code=403,
+            detail="Acesso restrito a administradores desta organização"
+        )
+
+    target = by_user.get(target_id)
+    if target is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Membro não encontrado nesta organização"
+        )
+
+    return target
+
+
 def get_user_org_id(user: AuthedUser) -> str:
     """
     Extract org_id from authenticated user.
@@ -7,11 +7,24 @@ from app.core.config import settings
 # Import all models to register them with SQLModel metadata
 from app.models import User, Organization, OrgDbConnection, OrgAllowedSchema, BizDocument, QueryAudit, OrgMember, ClarificationSession
 
-# Create database engine
-engine = create_engine(settings.CONFIG_DB_URL, pool_pre_ping=True, future=True)
+# Create database engine (QueuePool sized explicitly; defaults are 5 + 10 overflow)
+engine = create_engine(
+    settings.CONFIG_DB_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    future=True
+)
 
 # Create session factory
-SessionLocal = sessionmaker(bind=engine, class_=Session, autoflush=False, autocommit=False, future=True)
+# expire_on_commit=False: sessions are request-scoped, so objects we just wrote keep
+# their in-memory values instead of being reloaded with a SELECT on next access
+SessionLocal = sessionmaker(
+    bind=engine, class_=Session, autoflush=False, autocommit=False,
+    expire_on_commit=False, future=True
+)
 
 
 def get_db():
@@ -0,0 +1,21 @@
+"""
+JSON encoding for query-result payloads
+"""
+from datetime import timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict
+
+from fastapi.encoders import jsonable_encoder
+
+# Tipos das linhas MySQL com representação própria na resposta
+# (demais tipos seguem o jsonable_encoder padrão; desconhecidos levantam erro)
+QUERY_RESULT_ENCODERS: Dict[Any, Callable[[Any], Any]] = {
+    Decimal: float,
+    timedelta: str,
+    bytes: lambda b: b.decode("utf-8", errors="replace"),
+}
+
+
+def encode_query_result(result: Any) -> Any:
+    """Encode a query result (rows included) into JSON-compatible data"""
+    return jsonable_encoder(result, custom_encoder=QUERY_RESULT_ENCODERS)
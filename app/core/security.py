@@ -1,5 +1,6 @@
 import hashlib
 import secrets
+from functools import lru_cache
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 
@@ -35,6 +36,16 @@ def sha256_hex(s: str) -> str:
     return hashlib.sha256(s.encode()).hexdigest()
 
 
+def cache_key_hex(s: str) -> str:
+    """
+    Short non-persisted digest for in-process cache keys.
+
+    blake2b is faster than SHA-256 on CPUs without SHA extensions and a
+    128-bit digest is plenty for a key; don't use it for stored hashes.
+    """
+    return hashlib.blake2b(s.encode(), digest_size=16).hexdigest()
+
+
 # ========== JWT & Password Hashing ==========
 
 # JWT configuration
@@ -49,6 +60,8 @@ def hash_password(password: str) -> str:
     Hash a password using bcrypt.
 
     Note: bcrypt has a 72-byte limit, so we truncate longer passwords.
+    Cost comes from BCRYPT_ROUNDS; the C implementation releases the GIL,
+    so call it via run_in_threadpool from async handlers.
 
     Args:
         password: Plain text password
@@ -58,10 +71,25 @@ def hash_password(password: str) -> str:
     """
     # bcrypt has a 72-byte limit
     password_bytes = password.encode('utf-8')[:72]
-    hashed = bcrypt.hashpw(password_bytes, bcrypt.gensalt())
+    hashed = bcrypt.hashpw(password_bytes, bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS))
     return hashed.decode('utf-8')
 
 
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    """Fixed hash at the configured cost, used to equalize login timing"""
+    return hash_password(secrets.token_urlsafe(16))
+
+
+def verify_dummy_password(plain_password: str) -> bool:
+    """
+    Spend the same bcrypt time as a real check, always returning False.
+    Used when the email is unknown so response time doesn't reveal it.
+    """
+    verify_password(plain_password, _dummy_password_hash())
+    return False
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a password against a hash.
@@ -159,6 +187,6 @@ def generate_invite_token() -> str:
     Generate a secure random token for user invitations.
 
     Returns:
-        32-character hexadecimal token
+        URL-safe token (32 random bytes, 43 characters)
     """
-    return secrets.token_hex(32)
+    return secrets.token_urlsafe(32)
@@ -2,7 +2,7 @@
 Organization context DTO
 """
 from typing import Optional, List, Dict
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 
 class OrgContext(BaseModel):
@@ -28,11 +28,16 @@ class OrgContext(BaseModel):
     # Business context
     biz_context: str
 
+    _urls: Dict[str, str] = PrivateAttr(default_factory=dict)
+
     def build_sqlalchemy_url(self, schema: str) -> str:
-        """Build SQLAlchemy URL for a specific schema"""
-        from app.utils.database import build_sqlalchemy_url
-        return build_sqlalchemy_url(
-            self.driver, self.host, self.port,
-            self.username, self.password,
-            schema, self.options_json
-        )
+        """Build SQLAlchemy URL for a specific schema (memoized per schema)"""
+        url = self._urls.get(schema)
+        if url is None:
+            from app.utils.database import build_sqlalchemy_url
+            url = self._urls[schema] = build_sqlalchemy_url(
+                self.driver, self.host, self.port,
+                self.username, self.password,
+                schema, self.options_json
+            )
+        return url
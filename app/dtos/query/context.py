@@ -46,7 +46,7 @@ class StreamEvent(BaseModel):
     """
     Event emitted during streaming execution
     """
-    stage: str  # analyzing_intent, generating_sql, validating, executing, enriching, done
+    stage: str  # analyzing_intent, generating_sql, validating, executing, enriching, insight_token, done
     progress: int  # 0-100
     message: Optional[str] = None
     data: Optional[Dict[str, Any]] = None
@@ -1,11 +1,12 @@
-from uuid import uuid4
+import asyncio
+
+from anyio import to_thread
 from fastapi import FastAPI
-from sqlmodel import Session, select
+from fastapi.concurrency import run_in_threadpool
 
 from app.core.config import settings
-from app.core.database import init_db, SessionLocal
-from app.core.security import sha256_hex
-from app.models import User
+from app.core.database import init_db
+from app.repositories import sweep_expired_sessions
 from app.controllers import (
     auth_controller,
     database_controller,
@@ -28,6 +29,33 @@ def startup():
     """
     init_db()
 
+    # Session and model layer are synchronous: sync handlers and
+    # run_in_threadpool share this limiter, so size it for concurrency
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_MAX_WORKERS
+
+
+async def _sweep_clarifications_periodically():
+    """Delete expired clarification sessions now and then every CLARIFICATION_SWEEP_INTERVAL"""
+    while True:
+        await run_in_threadpool(sweep_expired_sessions)
+        await asyncio.sleep(settings.CLARIFICATION_SWEEP_INTERVAL)
+
+
+@app.on_event("startup")
+async def start_clarification_sweep():
+    """
+    Schedule the expired clarification session sweep (kept off the request path)
+    """
+    app.state.clarification_sweep = asyncio.create_task(_sweep_clarifications_periodically())
+
+
+@app.on_event("shutdown")
+async def stop_clarification_sweep():
+    """
+    Cancel the clarification session sweep
+    """
+    app.state.clarification_sweep.cancel()
+
 
 # Include routers
 app.include_router(auth_controller.router)  # JWT authentication endpoints (public)
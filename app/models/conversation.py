@@ -2,10 +2,10 @@
 Conversation/clarification session models - MVC2 Pattern
 MODEL = Entidade + Lógica de Acesso a Dados
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
-from sqlalchemy import JSON, Column, Text
-from sqlmodel import SQLModel, Field
+from sqlalchemy import JSON, Column, Index, Text
+from sqlmodel import SQLModel, Field, Relationship
 
 
 class ClarificationSession(SQLModel, table=True):
@@ -20,6 +20,10 @@ class ClarificationSession(SQLModel, table=True):
     - Armazenar estado da conversa de clarificação
     """
     __tablename__ = "clarification_sessions"
+    __table_args__ = (
+        # Limpeza de sessões expiradas: DELETE ... WHERE expires_at < ?
+        Index("idx_clarification_sessions_expires", "expires_at"),
+    )
 
     id: str = Field(primary_key=True)  # UUID
     org_id: str = Field(foreign_key="orgs.id", index=True)
@@ -43,6 +47,10 @@ class Conversation(SQLModel, table=True):
     - Metadados da conversa (título, timestamps, etc)
     """
     __tablename__ = "conversations"
+    __table_args__ = (
+        # Listagem paginada por keyset: WHERE user_id, org_id ORDER BY updated_at DESC, id DESC
+        Index("idx_conversations_user_org_updated", "user_id", "org_id", "updated_at", "id"),
+    )
 
     id: str = Field(primary_key=True)  # UUID
     org_id: str = Field(foreign_key="orgs.id", index=True)
@@ -51,6 +59,12 @@ class Conversation(SQLModel, table=True):
     created_at: datetime
     updated_at: datetime  # Last message timestamp
 
+    # Relationships (mensagens em ordem cronológica)
+    messages: List["ConversationMessage"] = Relationship(
+        back_populates="conversation",
+        sa_relationship_kwargs={"order_by": "ConversationMessage.created_at"},
+    )
+
 
 class ConversationMessage(SQLModel, table=True):
     """
@@ -81,3 +95,6 @@ class ConversationMessage(SQLModel, table=True):
     insights: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))  # {summary: str, chart: {...}}
 
     created_at: datetime
+
+    # Relationships
+    conversation: Optional[Conversation] = Relationship(back_populates="messages")
@@ -2,9 +2,9 @@
 Document models - MVC2 Pattern
 MODEL = Entidade + Lógica de Acesso a Dados
 """
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from sqlalchemy import JSON, Column, Integer
-from sqlmodel import SQLModel, Field, Relationship, Session, select
+from sqlmodel import SQLModel, Field, Relationship, Session, select, func
 
 
 class BizDocument(SQLModel, table=True):
@@ -73,6 +73,27 @@ class BizDocument(SQLModel, table=True):
             .limit(limit)
         ).all()
 
+    @classmethod
+    def list_by_org_light(
+        cls, db: Session, org_id: str, skip: int = 0, limit: int = 100, preview_chars: int = 200
+    ) -> List[Tuple[int, str, Optional[str], Optional[str]]]:
+        """
+        Listar documentos sem trazer o metadata_json inteiro
+
+        Retorna (id, title, type, preview); o conteúdo extraído é cortado no banco.
+        """
+        return db.exec(
+            select(
+                cls.id,
+                cls.title,
+                cls.metadata_json["type"].as_string(),
+                func.substr(cls.metadata_json["content"].as_string(), 1, preview_chars)
+            )
+            .where(cls.org_id == org_id)
+            .offset(skip)
+            .limit(limit)
+        ).all()
+
 
 class QueryAudit(SQLModel, table=True):
     """Auditoria de queries executadas"""
@@ -2,8 +2,10 @@
 Member models - MVC2 Pattern
 MODEL = Entidade + Lógica de Acesso a Dados
 """
-from typing import Optional, List
-from sqlmodel import SQLModel, Field, Relationship, Session, select
+from typing import Optional, List, Tuple
+from sqlalchemy import Index, bindparam
+from sqlalchemy.orm import raiseload
+from sqlmodel import SQLModel, Field, Relationship, Session, select, func
 
 
 class OrgMember(SQLModel, table=True):
@@ -18,6 +20,10 @@ class OrgMember(SQLModel, table=True):
     - Lógica de acesso a dados (CRUD)
     """
     __tablename__ = "org_members"
+    __table_args__ = (
+        # PK (user_id, org_id) não cobre buscas por org: listagem e contagem de admins
+        Index("idx_org_members_org_role", "org_id", "role_in_org"),
+    )
 
     user_id: str = Field(foreign_key="users.id", primary_key=True)
     org_id: str = Field(foreign_key="orgs.id", primary_key=True)
@@ -33,13 +39,20 @@ class OrgMember(SQLModel, table=True):
 
     @classmethod
     def get_member(cls, db: Session, user_id: str, org_id: str) -> Optional["OrgMember"]:
-        """Buscar membro específico"""
-        return db.exec(
-            select(cls).where(
-                cls.user_id == user_id,
-                cls.org_id == org_id
-            )
-        ).first()
+        """Buscar membro específico (statement pré-construído, só troca os binds)"""
+        return db.exec(_GET_MEMBER, params={"user_id": user_id, "org_id": org_id}).first()
+
+    @classmethod
+    def is_admin(cls, db: Session, user_id: str, org_id: Optional[str] = None) -> bool:
+        """Verificar se usuário é admin da organização (ou de alguma, se org_id=None)"""
+        if org_id is not None:
+            return db.exec(_IS_ADMIN_OF_ORG, params={"user_id": user_id, "org_id": org_id}).one()
+        return db.exec(_IS_ADMIN_OF_ANY, params={"user_id": user_id}).one()
+
+    @classmethod
+    def count_admins(cls, db: Session, org_id: str) -> int:
+        """Contar admins da organização (COUNT no índice org_id + role_in_org)"""
+        return db.exec(_COUNT_ADMINS, params={"org_id": org_id}).one()
 
     @classmethod
     def create(cls, db: Session, user_id: str, org_id: str, role_in_org: str = "member") -> "OrgMember":
@@ -73,6 +86,23 @@ class OrgMember(SQLModel, table=True):
         """Listar membros de uma organização"""
         return db.exec(
             select(cls)
+            .options(raiseload("*"))
+            .where(cls.org_id == org_id)
+            .offset(skip)
+            .limit(limit)
+        ).all()
+
+    @classmethod
+    def list_with_users_by_org(
+        cls, db: Session, org_id: str, skip: int = 0, limit: int = 100
+    ) -> List[Tuple["OrgMember", "User"]]:
+        """Listar membros de uma organização junto com seus usuários (um único JOIN)"""
+        from app.models.user_model import User
+
+        return db.exec(
+            select(cls, User)
+            .join(User, User.id == cls.user_id)
+            .options(raiseload("*"))
             .where(cls.org_id == org_id)
             .offset(skip)
             .limit(limit)
@@ -82,10 +112,27 @@ class OrgMember(SQLModel, table=True):
     def list_by_user(cls, db: Session, user_id: str) -> List["OrgMember"]:
         """Listar organizações de um usuário"""
         return db.exec(
-            select(cls).where(cls.user_id == user_id)
+            select(cls).options(raiseload("*")).where(cls.user_id == user_id)
         ).all()
 
 
+# Statements fixos das checagens de membro/admin: construídos uma vez, reaproveitam o cache de compilação
+_GET_MEMBER = select(OrgMember).options(raiseload("*")).where(
+    OrgMember.user_id == bindparam("user_id"),
+    OrgMember.org_id == bindparam("org_id")
+)
+_ADMIN_LINKS = select(OrgMember.user_id).where(
+    OrgMember.user_id == bindparam("user_id"),
+    OrgMember.role_in_org == "admin"
+)
+_IS_ADMIN_OF_ANY = select(_ADMIN_LINKS.exists())
+_IS_ADMIN_OF_ORG = select(_ADMIN_LINKS.where(OrgMember.org_id == bindparam("org_id")).exists())
+_COUNT_ADMINS = select(func.count()).select_from(OrgMember).where(
+    OrgMember.org_id == bindparam("org_id"),
+    OrgMember.role_in_org == "admin"
+)
+
+
 # ============================================================
 # DTOs (Request/Response)
 # ============================================================
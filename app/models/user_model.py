@@ -4,6 +4,8 @@ MODEL = Entidade + Lógica de Acesso a Dados
 """
 from typing import List, Optional
 from datetime import datetime
+from sqlalchemy import bindparam
+from sqlalchemy.orm import raiseload
 from sqlmodel import SQLModel, Field, Relationship, Session, select
 
 
@@ -43,8 +45,13 @@ class User(SQLModel, table=True):
 
     @classmethod
     def get_by_email(cls, db: Session, email: str) -> Optional["User"]:
-        """Buscar usuário por email"""
-        return db.exec(select(cls).where(cls.email == email)).first()
+        """Buscar usuário por email (statement pré-construído, só troca o bind)"""
+        return db.exec(_USER_BY_EMAIL, params={"email": email}).first()
+
+    @classmethod
+    def email_exists(cls, db: Session, email: str) -> bool:
+        """Verificar se email já está cadastrado (EXISTS, sem carregar a linha)"""
+        return db.exec(select(select(cls.id).where(cls.email == email).exists())).one()
 
     @classmethod
     def get_by_id(cls, db: Session, user_id: str) -> Optional["User"]:
@@ -82,6 +89,10 @@ class User(SQLModel, table=True):
         return db.exec(select(cls).offset(skip).limit(limit)).all()
 
 
+# Statement fixo do login: construído uma vez, reaproveita o cache de compilação
+_USER_BY_EMAIL = select(User).options(raiseload("*")).where(User.email == bindparam("email"))
+
+
 # ============================================================
 # DTOs (Request/Response) - Mesmo arquivo, menos código!
 # ============================================================
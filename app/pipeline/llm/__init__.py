@@ -1,7 +1,7 @@
 """
 LLM utilities (client, prompts, parsers)
 """
-from app.pipeline.llm.client import call_llm, call_llm_async
+from app.pipeline.llm.client import call_llm, call_llm_async, call_llm_stream
 from app.pipeline.llm.prompts import (
     build_intent_analysis_prompt,
     build_sql_generation_prompt,
@@ -14,6 +14,7 @@ from app.pipeline.llm.parsers import parse_sql, parse_json
 __all__ = [
     "call_llm",
     "call_llm_async",
+    "call_llm_stream",
     "build_intent_analysis_prompt",
     "build_sql_generation_prompt",
     "build_sql_correction_prompt",
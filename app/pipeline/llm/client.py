@@ -2,13 +2,20 @@
 LLM client for Azure OpenAI
 """
 import httpx
+import json
 import time
 import asyncio
 import logging
+from typing import Callable
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Shared sync client: keeps TLS connections to Azure warm across calls (thread-safe)
+_HTTP_CLIENT = httpx.Client(timeout=30.0)
+# Shared async client: same warm connection pool for call_llm_async (chart endpoints, parallel SQL)
+_ASYNC_HTTP_CLIENT = httpx.AsyncClient(timeout=30.0)
+
 
 def call_llm(
     messages: list[dict],
@@ -39,11 +46,10 @@ def call_llm(
     # Retry 3 times
     for attempt in range(3):
         try:
-            with httpx.Client(timeout=30.0) as client:
-                response = client.post(url, headers=headers, json=payload)
-                response.raise_for_status()
-                data = response.json()
-                return data["choices"][0]["message"]["content"]
+            response = _HTTP_CLIENT.post(url, headers=headers, json=payload)
+            response.raise_for_status()
+            data = response.json()
+            return data["choices"][0]["message"]["content"]
         except Exception as e:
             if attempt == 2:
                 logger.error(f"LLM call failed after 3 attempts: {e}")
@@ -53,6 +59,62 @@ def call_llm(
             time.sleep(wait_time)
 
 
+def call_llm_stream(
+    messages: list[dict],
+    on_token: Callable[[str], None],
+    temperature: float = 0.1,
+    max_tokens: int = 800
+) -> str:
+    """
+    Call Azure OpenAI with stream=True, passing each content delta to on_token
+    Returns the full content string
+
+    Retries only while nothing was emitted yet (a partial answer can't be replayed)
+    """
+    url = (
+        f"{settings.AZURE_OPENAI_ENDPOINT}/openai/deployments/"
+        f"{settings.AZURE_OPENAI_DEPLOYMENT}/chat/completions?"
+        f"api-version={settings.AZURE_OPENAI_API_VERSION}"
+    )
+
+    headers = {
+        "Content-Type": "application/json",
+        "api-key": settings.AZURE_OPENAI_API_KEY
+    }
+
+    payload = {
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "stream": True
+    }
+
+    for attempt in range(3):
+        parts: list[str] = []
+        try:
+            with _HTTP_CLIENT.stream("POST", url, headers=headers, json=payload) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    chunk = line[len("data: "):]
+                    if chunk == "[DONE]":
+                        break
+                    choices = json.loads(chunk).get("choices") or []
+                    delta = (choices[0].get("delta") or {}).get("content") if choices else None
+                    if delta:
+                        parts.append(delta)
+                        on_token(delta)
+            return "".join(parts)
+        except Exception as e:
+            if parts or attempt == 2:
+                logger.error(f"Streaming LLM call failed: {e}")
+                raise
+            wait_time = 2 ** attempt
+            logger.warning(f"Stream attempt {attempt + 1} failed, retrying in {wait_time}s...")
+            time.sleep(wait_time)
+
+
 async def call_llm_async(
     messages: list[dict],
     temperature: float = 0.1,
@@ -82,11 +144,10 @@ async def call_llm_async(
     # Retry 3 times
     for attempt in range(3):
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, headers=headers, json=payload)
-                response.raise_for_status()
-                data = response.json()
-                return data["choices"][0]["message"]["content"]
+            response = await _ASYNC_HTTP_CLIENT.post(url, headers=headers, json=payload)
+            response.raise_for_status()
+            data = response.json()
+            return data["choices"][0]["message"]["content"]
         except Exception as e:
             if attempt == 2:
                 logger.error(f"Async LLM call failed after 3 attempts: {e}")
@@ -1,5 +1,8 @@
 """
 All LLM prompts consolidated in one place
+
+Ordem dos prompts: conteúdo fixo (system, schema, contexto) antes do que
+muda por pergunta, para o prefix caching do provedor reaproveitar o início.
 """
 
 
@@ -92,13 +95,8 @@ AVALIE: (1º) Schema suporta? (2º) Se sim, está claro ou precisa clarificaçã
 # SQL GENERATION PROMPTS
 # ============================================
 
-def build_sql_generation_prompt(
-    pergunta: str,
-    esquema: str,
-    limit: int
-) -> list[dict]:
-    """Build NL→SQL prompt"""
-    system = f"""Você é um tradutor de linguagem natural para SQL (dialeto MySQL).
+# NL→SQL system prompt: byte-identical for every request (LIMIT goes at the end of the user message)
+_SQL_GENERATION_SYSTEM = """Você é um tradutor de linguagem natural para SQL (dialeto MySQL).
 
 REGRAS OBRIGATÓRIAS:
 - Gere SOMENTE uma query SELECT válida
@@ -108,7 +106,7 @@ REGRAS OBRIGATÓRIAS:
 - Todas as informações necessárias já estão no schema fornecido
 - Prefira JOINs com PK/FK explícitas (use as colunas exatas mostradas em [FK: ...])
 - NUNCA modifique dados (sem INSERT/UPDATE/DELETE/DDL)
-- ⚠️ SEMPRE termine com LIMIT {limit} (use EXATAMENTE {limit}, não outro valor)
+- ⚠️ SEMPRE termine com o LIMIT indicado ao final da mensagem (use EXATAMENTE esse valor, não outro)
 - Responda APENAS com o SQL, sem explicações
 
 ⭐ REGRA IMPORTANTE - NOMES LEGÍVEIS:
@@ -137,28 +135,31 @@ EXEMPLOS INCORRETOS:
 ❌ SELECT coluna FROM tabela;  (falta LIMIT quando necessário)
 ❌ -- Este SQL busca... SELECT coluna FROM tabela;  (tem comentário)"""
 
+
+def build_sql_generation_prompt(
+    pergunta: str,
+    esquema: str,
+    limit: int
+) -> list[dict]:
+    """Build NL→SQL prompt"""
     user = f"""Schema:
 {esquema}
 
 Pergunta:
 {pergunta}
 
+LIMIT obrigatório: {limit}
+
 SQL:"""
 
     return [
-        {"role": "system", "content": system},
+        {"role": "system", "content": _SQL_GENERATION_SYSTEM},
         {"role": "user", "content": user}
     ]
 
 
-def build_sql_correction_prompt(
-    sql_original: str,
-    erro: str,
-    esquema: str,
-    limit: int
-) -> list[dict]:
-    """Build SQL correction prompt"""
-    system = f"""Você corrige SQL que gerou erros.
+# SQL correction system prompt: also LIMIT-independent
+_SQL_CORRECTION_SYSTEM = """Você corrige SQL que gerou erros.
 
 REGRAS:
 - Retorne APENAS o SQL corrigido (uma única query)
@@ -167,7 +168,7 @@ REGRAS:
 - Sem múltiplos statements (sem vários ponto-e-vírgulas)
 - Sem explicações
 - Sem comentários
-- ⚠️ SEMPRE termine com LIMIT {limit} (use EXATAMENTE {limit}, não outro valor)
+- ⚠️ SEMPRE termine com o LIMIT indicado ao final da mensagem (use EXATAMENTE esse valor, não outro)
 
 EXEMPLO CORRETO:
 SELECT coluna FROM tabela WHERE condicao LIMIT 10;
@@ -176,6 +177,14 @@ EXEMPLOS INCORRETOS:
 ❌ SELECT coluna FROM tabela; LIMIT 10;  (ponto-e-vírgula no meio)
 ❌ Aqui está o SQL corrigido: SELECT...  (tem explicação)"""
 
+
+def build_sql_correction_prompt(
+    sql_original: str,
+    erro: str,
+    esquema: str,
+    limit: int
+) -> list[dict]:
+    """Build SQL correction prompt"""
     user = f"""Schema:
 {esquema}
 
@@ -185,10 +194,12 @@ SQL que gerou erro:
 Erro:
 {erro}
 
+LIMIT obrigatório: {limit}
+
 SQL corrigido:"""
 
     return [
-        {"role": "system", "content": system},
+        {"role": "system", "content": _SQL_CORRECTION_SYSTEM},
         {"role": "user", "content": user}
     ]
 
@@ -1,13 +1,19 @@
 import re
-import time
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, FrozenSet, List, Set, Tuple
 from sqlalchemy import text as sqltext, bindparam
 from sqlalchemy.engine import Connection
 
+from app.core.config import settings
+from app.utils.cache import TTLCache
 
-# Schema index cache
-_SCHEMA_INDEX_CACHE: Dict[str, Dict[str, Set[str]]] = {}
-_SCHEMA_INDEX_TTL: Dict[str, float] = {}
+
+# Schema index cache: (org_id, allowed schemas) → {schema: frozenset(tokens)}
+_SCHEMA_INDEX_CACHE = TTLCache(maxsize=settings.CATALOG_CACHE_MAX_SIZE, ttl=settings.SCHEMA_INDEX_MAX_AGE)
+
+_TOKEN_RE = re.compile(r"[a-zA-Z0-9_]+")
+
+# Catalog cache: (org_id, schema) → (catalog, esquema_txt)
+_CATALOG_CACHE = TTLCache(maxsize=settings.CATALOG_CACHE_MAX_SIZE, ttl=settings.CATALOG_CACHE_TTL)
 
 
 def catalog_for_current_db(conn: Connection, db_name: str) -> Dict[str, Any]:
@@ -82,18 +88,44 @@ def esquema_resumido(catalog: Dict[str, Any], max_chars: int = 4000) -> str:
     return texto[:max_chars]
 
 
+def get_catalog_for_org(
+    org_id: str,
+    db_url: str,
+    db_name: str
+) -> Tuple[Dict[str, Any], str]:
+    """
+    Get catalog and its summarized text for an org schema with caching
+
+    Both are cached together so the esquema_resumido cost is paid once
+    per TTL window instead of on every question. A connection is only
+    checked out on a miss.
+    """
+    from app.utils.database import get_engine
+
+    key = (org_id, db_name)
+    cached = _CATALOG_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    with get_engine(db_url).connect() as conn:
+        catalog = catalog_for_current_db(conn, db_name=db_name)
+    cached = (catalog, esquema_resumido(catalog))
+    _CATALOG_CACHE.set(key, cached)
+
+    return cached
+
+
 def normalize_tokens(*parts: str) -> Set[str]:
     """
     Normalize strings into lowercase tokens for schema matching
     """
     toks: Set[str] = set()
     for p in parts:
-        for t in re.findall(r"[a-zA-Z0-9_]+", (p or "").lower()):
-            toks.add(t)
+        toks.update(_TOKEN_RE.findall((p or "").lower()))
     return toks
 
 
-def build_schema_index(conn: Connection, allowed_schemas: List[str]) -> Dict[str, Set[str]]:
+def build_schema_index(conn: Connection, allowed_schemas: List[str]) -> Dict[str, FrozenSet[str]]:
     """
     Build an inverted index of tokens (table/column names) per schema
     """
@@ -108,42 +140,44 @@ def build_schema_index(conn: Connection, allowed_schemas: List[str]) -> Dict[str
 
     index: Dict[str, Set[str]] = {s: set() for s in allowed_schemas}
     for schema, table, col in rows:
-        index[schema].add((table or "").lower())
-        index[schema].add((col or "").lower())
+        for name in ((table or "").lower(), (col or "").lower()):
+            index[schema].add(name)
+            # snake_case parts too ("first_name" → "first", "name"), so "first name" in the question matches
+            index[schema].update(part for part in name.split("_") if len(part) >= 3)
 
-    return index
+    # Frozen once at build time; ranking only intersects them
+    return {s: frozenset(toks) for s, toks in index.items()}
 
 
 def get_schema_index_for_org(
     org_id: str,
     base_db_url_with_default: str,
     allowed: List[str]
-) -> Dict[str, Set[str]]:
+) -> Dict[str, FrozenSet[str]]:
     """
     Get or build schema index for an organization with caching
+
+    Keyed by the allowed schema list too, so granting/revoking a schema
+    rebuilds the index instead of serving a stale one.
     """
-    from sqlalchemy import create_engine
-    from app.core.config import settings
+    from app.utils.database import get_engine
 
-    now = time.time()
-    if (
-        org_id in _SCHEMA_INDEX_CACHE
-        and (now - _SCHEMA_INDEX_TTL.get(org_id, 0) < settings.SCHEMA_INDEX_MAX_AGE)
-    ):
-        return _SCHEMA_INDEX_CACHE[org_id]
+    key = (org_id, tuple(allowed))
+    idx = _SCHEMA_INDEX_CACHE.get(key)
+    if idx is not None:
+        return idx
 
-    eng = create_engine(base_db_url_with_default, pool_pre_ping=True, future=True)
+    eng = get_engine(base_db_url_with_default)
     with eng.connect() as conn:
         idx = build_schema_index(conn, allowed)
 
-    _SCHEMA_INDEX_CACHE[org_id] = idx
-    _SCHEMA_INDEX_TTL[org_id] = now
+    _SCHEMA_INDEX_CACHE.set(key, idx)
 
     return idx
 
 
 def rank_schemas_by_overlap(
-    schema_index: Dict[str, Set[str]],
+    schema_index: Dict[str, FrozenSet[str]],
     pergunta: str
 ) -> List[tuple[str, int]]:
     """
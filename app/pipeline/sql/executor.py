@@ -10,8 +10,11 @@ from sqlalchemy.engine import Connection
 def executar_sql_readonly_on_conn(conn: Connection, sql: str) -> Dict[str, Any]:
     """
     Execute a read-only SQL query and return results as JSON-serializable dict
+
+    Rows come back as lists in `colunas` order (no per-row dict, and
+    duplicated column names don't collapse).
     """
     rs = conn.execute(sqltext(sql))
     cols = list(rs.keys())
-    dados = [dict(zip(cols, row)) for row in rs]
+    dados = [list(row) for row in rs]
     return {"colunas": cols, "dados": dados}
@@ -0,0 +1,73 @@
+"""
+Deterministic SQL repair
+Fixes common execution errors without an LLM round trip
+"""
+import difflib
+import re
+from typing import Dict, Any, List, Optional
+
+# MySQL 1054: Unknown column 'alias.col' in 'field list'
+_UNKNOWN_COLUMN_RE = re.compile(r"Unknown column '([^']+)'", re.I)
+
+# Quoted string literals ('...' / "..."), with backslash and doubled-quote escapes
+_STRING_LITERAL_RE = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.|\"\")*\"", re.S)
+
+_TABLE_REF_RE = re.compile(
+    r'(?:from|join)\s+(?:[`"]?[a-zA-Z0-9_]+[`"]?\.)?[`"]?([a-zA-Z0-9_]+)[`"]?',
+    re.I
+)
+
+
+def _columns_in_scope(sql: str, catalog: Dict[str, Any]) -> List[str]:
+    """Columns of the tables referenced by the SQL (all catalog columns if none match)"""
+    tables = {t.lower(): meta for t, meta in catalog["tables"].items()}
+    used = {t.lower() for t in _TABLE_REF_RE.findall(sql)} & tables.keys()
+    scope = [tables[t] for t in used] or list(tables.values())
+    return sorted({c["name"] for meta in scope for c in meta["columns"]})
+
+
+def reparar_coluna_desconhecida(sql: str, erro: str, catalog: Dict[str, Any]) -> Optional[str]:
+    """
+    Rewrite a misspelled column reported by MySQL to the closest catalog column
+
+    Returns the rewritten SQL, or None when the error isn't an unknown column
+    or there is no single close match (caller falls back to the LLM).
+    """
+    m = _UNKNOWN_COLUMN_RE.search(erro)
+    if not m:
+        return None
+
+    ref = m.group(1)
+    qualifier, _, col = ref.rpartition(".")
+
+    scored = sorted(
+        ((difflib.SequenceMatcher(None, col.lower(), c.lower()).ratio(), c)
+         for c in _columns_in_scope(sql, catalog)),
+        reverse=True
+    )
+    # Nothing close enough, or two equally close names → don't guess
+    if not scored or scored[0][0] < 0.8 or (len(scored) > 1 and scored[1][0] == scored[0][0]):
+        return None
+    fixed = scored[0][1]
+    # Column exists elsewhere in scope (wrong alias/table): renaming won't help, let the LLM fix it
+    if fixed.lower() == col.lower():
+        return None
+
+    # Replace only the offending reference (alias prefix kept), never inside string literals
+    prefix = rf"`?{re.escape(qualifier)}`?\." if qualifier else r"(?<![\w.`])"
+    pattern = re.compile(rf"({prefix})`?{re.escape(col)}`?(?![\w`])")
+
+    parts: List[str] = []
+    n = 0
+    pos = 0
+    for lit in _STRING_LITERAL_RE.finditer(sql):
+        code, k = pattern.subn(lambda mm: f"{mm.group(1)}{fixed}", sql[pos:lit.start()])
+        parts += [code, lit.group(0)]
+        n += k
+        pos = lit.end()
+    code, k = pattern.subn(lambda mm: f"{mm.group(1)}{fixed}", sql[pos:])
+    parts.append(code)
+    n += k
+
+    repaired = "".join(parts)
+    return repaired if n and repaired != sql else None
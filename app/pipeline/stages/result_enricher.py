@@ -3,8 +3,9 @@ Stage 5: Result Enrichment
 Generates business insights and charts from query results
 """
 import logging
+from typing import Callable, Optional
 from pydantic import BaseModel
-from app.pipeline.llm.client import call_llm
+from app.pipeline.llm.client import call_llm, call_llm_stream
 from app.pipeline.llm.prompts import build_insights_prompt
 
 logger = logging.getLogger(__name__)
@@ -39,14 +40,15 @@ def generate_insights(
     pergunta: str,
     colunas: list[str],
     dados: list[list],
-    biz_context: str = ""
+    biz_context: str = "",
+    token_callback: Optional[Callable[[str], None]] = None
 ) -> str:
     """
     Generate business insights from query results
 
     Simple 3-step process:
     1. Build insights prompt
-    2. Call LLM
+    2. Call LLM (streamed to token_callback when given)
     3. Return insights text
 
     Returns insights string
@@ -59,7 +61,10 @@ def generate_insights(
     messages = build_insights_prompt(pergunta, colunas, dados_sample, biz_context)
 
     # Step 2: Call LLM
-    response = call_llm(messages, temperature=0.2, max_tokens=500)
+    if token_callback:
+        response = call_llm_stream(messages, token_callback, temperature=0.2, max_tokens=500)
+    else:
+        response = call_llm(messages, temperature=0.2, max_tokens=500)
 
     # Step 3: Return insights
     logger.info("Insights generated successfully")
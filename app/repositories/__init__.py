@@ -1,15 +1,17 @@
 """
 Repository layer for data access
 """
-from app.repositories.org_repository import OrgRepository
-from app.repositories.clarification_repository import ClarificationRepository
+from app.repositories.org_repository import OrgRepository, invalidate_org_context_cache
+from app.repositories.clarification_repository import ClarificationRepository, sweep_expired_sessions
 from app.repositories.audit_repository import AuditRepository
 from app.repositories.conversation_repository import ConversationRepository
 from app.repositories.query_history_repository import QueryHistoryRepository
 
 __all__ = [
     "OrgRepository",
+    "invalidate_org_context_cache",
     "ClarificationRepository",
+    "sweep_expired_sessions",
     "AuditRepository",
     "ConversationRepository",
     "QueryHistoryRepository",
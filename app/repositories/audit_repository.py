@@ -3,6 +3,7 @@ Repository for QueryAudit logs
 """
 import logging
 from typing import Optional
+from fastapi import BackgroundTasks
 from sqlmodel import Session
 from app.models import QueryAudit
 from app.dtos import QueryExecutionContext
@@ -54,16 +55,61 @@ class AuditRepository:
             # Best-effort: do not raise exception
             # Audit failure should not break user flow
 
-    def log_from_context(self, org_id: str, ctx: QueryExecutionContext) -> None:
+    @staticmethod
+    def log_query_detached(
+        org_id: str,
+        schema_used: str,
+        prompt_snip: str,
+        sql_text: str,
+        row_count: Optional[int] = None,
+        duration_ms: Optional[int] = None
+    ) -> None:
+        """
+        Log query using a short-lived session of its own
+
+        Meant to run as a background task, after the request
+        session has already been closed
+        """
+        from app.core.database import SessionLocal
+
+        with SessionLocal() as session:
+            AuditRepository(session).log_query(
+                org_id=org_id,
+                schema_used=schema_used,
+                prompt_snip=prompt_snip,
+                sql_text=sql_text,
+                row_count=row_count,
+                duration_ms=duration_ms
+            )
+
+    def log_from_context(
+        self,
+        org_id: str,
+        ctx: QueryExecutionContext,
+        background_tasks: Optional[BackgroundTasks] = None
+    ) -> None:
         """
         Log query from QueryExecutionContext
 
-        Convenience method for service layer
+        Convenience method for service layer. When background_tasks is
+        given, the write is deferred until after the response is sent.
         """
         if not ctx.sql_executed or not ctx.schema_used:
             logger.debug("Skipping audit log: incomplete context")
             return
 
+        if background_tasks is not None:
+            background_tasks.add_task(
+                self.log_query_detached,
+                org_id=org_id,
+                schema_used=ctx.schema_used,
+                prompt_snip=ctx.pergunta,
+                sql_text=ctx.sql_executed,
+                row_count=ctx.row_count,
+                duration_ms=ctx.duration_ms
+            )
+            return
+
         self.log_query(
             org_id=org_id,
             schema_used=ctx.schema_used,
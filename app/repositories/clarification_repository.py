@@ -6,6 +6,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import Optional
 from fastapi import HTTPException
+from sqlalchemy import delete
 from sqlmodel import Session
 from app.models import ClarificationSession
 from app.dtos import IntentAnalysisResult
@@ -55,7 +56,6 @@ class ClarificationRepository:
 
         self.session.add(session)
         self.session.commit()
-        self.session.refresh(session)
 
         logger.info(f"Created clarification session {session.id} (expires in {ttl_minutes} min)")
 
@@ -105,26 +105,39 @@ class ClarificationRepository:
         """
         Clean up expired sessions
 
+        Single DELETE on the expires_at index (no rows loaded into the ORM)
+
         Args:
-            older_than_minutes: Delete sessions older than this (default: 30)
+            older_than_minutes: Delete sessions expired for longer than this (default: 30)
 
         Returns:
             Number of sessions deleted
         """
         cutoff = datetime.utcnow() - timedelta(minutes=older_than_minutes)
 
-        from sqlmodel import select
-        statement = select(ClarificationSession).where(
-            ClarificationSession.created_at < cutoff
+        result = self.session.execute(
+            delete(ClarificationSession).where(ClarificationSession.expires_at < cutoff)
         )
-        expired = self.session.exec(statement).all()
-
-        count = len(expired)
-        for s in expired:
-            self.session.delete(s)
+        self.session.commit()
 
+        count = result.rowcount or 0
         if count > 0:
-            self.session.commit()
             logger.info(f"Cleaned up {count} expired clarification sessions")
 
         return count
+
+
+def sweep_expired_sessions() -> int:
+    """
+    Delete expired clarification sessions using a short-lived session of its own
+
+    Run periodically by the app (not per request); best-effort, returns 0 on failure
+    """
+    from app.core.database import SessionLocal
+
+    try:
+        with SessionLocal() as session:
+            return ClarificationRepository(session).cleanup_expired_sessions()
+    except Exception as e:
+        logger.warning(f"Failed to clean up expired clarification sessions: {e}")
+        return 0
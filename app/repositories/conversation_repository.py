@@ -2,15 +2,50 @@
 Repository for Conversation data access
 """
 import uuid
+import base64
 import logging
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from fastapi import HTTPException
-from sqlmodel import Session, select
+from sqlalchemy import and_, bindparam, or_
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, select, func, update
 from app.models import Conversation, ConversationMessage
 
 logger = logging.getLogger(__name__)
 
+# Título usado até a primeira pergunta gerar um título real
+DEFAULT_CONVERSATION_TITLE = "Nova Conversa"
+
+
+# Statements fixos das leituras de mensagens: construídos uma vez, só trocam os binds.
+# IN com bindparam expanding mantém uma única entrada no cache de compilação para qualquer
+# quantidade de ids (pymysql não tem prepared statements no servidor nem ANY(array)).
+_MESSAGES_BY_CONVERSATION = (
+    select(ConversationMessage)
+    .where(ConversationMessage.conversation_id == bindparam("conversation_id"))
+    .order_by(ConversationMessage.created_at.asc())
+)
+_MESSAGE_COUNTS_BY_CONVERSATION = (
+    select(ConversationMessage.conversation_id, func.count())
+    .where(ConversationMessage.conversation_id.in_(bindparam("conversation_ids", expanding=True)))
+    .group_by(ConversationMessage.conversation_id)
+)
+
+
+def encode_conversation_cursor(conversation: Conversation) -> str:
+    """Opaque keyset cursor for (updated_at, id) of the last listed conversation"""
+    raw = f"{conversation.updated_at.isoformat()}|{conversation.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_conversation_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        ts, conv_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(ts), conv_id
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Cursor inválido")
+
 
 class ConversationRepository:
     """Handles Conversation and ConversationMessage CRUD operations"""
@@ -47,22 +82,31 @@ class ConversationRepository:
 
         self.session.add(conversation)
         self.session.commit()
-        self.session.refresh(conversation)
 
         logger.info(f"Created conversation {conversation.id} for user {user_id}")
 
         return conversation
 
-    def get_conversation(self, conversation_id: str, user_id: str) -> Conversation:
+    def get_conversation(
+        self,
+        conversation_id: str,
+        user_id: str,
+        load_messages: bool = False
+    ) -> Conversation:
         """
         Get conversation by ID
 
         Validates that user owns the conversation
 
+        Args:
+            load_messages: Eager-load `conversation.messages` (selectinload)
+                so callers don't need a separate get_messages call
+
         Raises:
             HTTPException: If conversation not found or unauthorized
         """
-        conversation = self.session.get(Conversation, conversation_id)
+        options = [selectinload(Conversation.messages)] if load_messages else None
+        conversation = self.session.get(Conversation, conversation_id, options=options)
 
         if not conversation:
             raise HTTPException(
@@ -83,34 +127,104 @@ class ConversationRepository:
         user_id: str,
         org_id: str,
         limit: int = 50,
-        offset: int = 0
-    ) -> List[Conversation]:
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Conversation], int]:
         """
-        List user's conversations
+        List user's conversations (page + total)
 
         Args:
             user_id: User ID
             org_id: Organization ID
             limit: Max conversations to return
-            offset: Pagination offset
+            offset: Pagination offset (deprecated, ignored when cursor is given)
+            cursor: Keyset cursor from encode_conversation_cursor (next page)
 
         Returns:
-            List of conversations ordered by updated_at desc
+            (conversations ordered by updated_at desc, id desc, total count
+            of the user's conversations in the org)
         """
+        # COUNT(*) OVER () traz o total junto com a página (antes do LIMIT)
         statement = (
-            select(Conversation)
+            select(Conversation, func.count().over().label("total_count"))
             .where(Conversation.user_id == user_id)
             .where(Conversation.org_id == org_id)
-            .order_by(Conversation.updated_at.desc())
+            .order_by(Conversation.updated_at.desc(), Conversation.id.desc())
             .limit(limit)
-            .offset(offset)
         )
 
-        conversations = self.session.exec(statement).all()
+        if cursor:
+            # Keyset: custo O(limit) independente da profundidade da página
+            cur_ts, cur_id = _decode_conversation_cursor(cursor)
+            statement = statement.where(
+                or_(
+                    Conversation.updated_at < cur_ts,
+                    and_(Conversation.updated_at == cur_ts, Conversation.id < cur_id)
+                )
+            )
+        elif offset:
+            statement = statement.offset(offset)
+
+        rows = self.session.exec(statement).all()
+        conversations = [conv for conv, _ in rows]
+
+        if cursor or (offset and not rows):
+            # Com cursor a janela só conta o que vem depois dele; página vazia não traz total
+            total = self.count_conversations(user_id, org_id)
+        else:
+            total = rows[0][1] if rows else 0
 
         logger.info(f"Listed {len(conversations)} conversations for user {user_id}")
 
-        return list(conversations)
+        return conversations, total
+
+    def count_conversations(self, user_id: str, org_id: str) -> int:
+        """
+        Count user's conversations in the organization (total for pagination)
+        """
+        statement = (
+            select(func.count())
+            .select_from(Conversation)
+            .where(Conversation.user_id == user_id)
+            .where(Conversation.org_id == org_id)
+        )
+        return self.session.exec(statement).one()
+
+    def count_messages_by_ids(self, conversation_ids: List[str]) -> Dict[str, int]:
+        """
+        Count messages for several conversations in a single GROUP BY query
+
+        Returns:
+            Dict conversation_id -> message count (conversations without
+            messages are absent)
+        """
+        if not conversation_ids:
+            return {}
+
+        rows = self.session.exec(
+            _MESSAGE_COUNTS_BY_CONVERSATION,
+            params={"conversation_ids": list(conversation_ids)}
+        ).all()
+        return {conv_id: count for conv_id, count in rows}
+
+    def update_title_if_unset(self, conversation_id: str, title: str) -> bool:
+        """
+        Set conversation title only while it still has the default title
+
+        Single UPDATE (no SELECT/refresh of the conversation); the WHERE
+        clause keeps titles that were already set.
+
+        Returns:
+            True if the title was updated
+        """
+        result = self.session.exec(
+            update(Conversation)
+            .where(Conversation.id == conversation_id)
+            .where(Conversation.title == DEFAULT_CONVERSATION_TITLE)
+            .values(title=title)
+        )
+        self.session.commit()
+        return result.rowcount > 0
 
     def add_message(
         self,
@@ -163,7 +277,6 @@ class ConversationRepository:
             conversation.updated_at = datetime.utcnow()
 
         self.session.commit()
-        self.session.refresh(message)
 
         logger.info(f"Added {role} message to conversation {conversation_id}")
 
@@ -184,16 +297,11 @@ class ConversationRepository:
         Returns:
             List of messages ordered by created_at asc
         """
-        statement = (
-            select(ConversationMessage)
-            .where(ConversationMessage.conversation_id == conversation_id)
-            .order_by(ConversationMessage.created_at.asc())
-        )
-
+        statement = _MESSAGES_BY_CONVERSATION
         if limit:
             statement = statement.limit(limit)
 
-        messages = self.session.exec(statement).all()
+        messages = self.session.exec(statement, params={"conversation_id": conversation_id}).all()
 
         return list(messages)
 
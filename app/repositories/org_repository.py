@@ -3,15 +3,44 @@ Repository for Organization data access
 Encapsulates logic for loading org context
 """
 import logging
+from functools import lru_cache
 from typing import Optional
 from fastapi import HTTPException
-from sqlmodel import Session
-from app.models import Organization
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from sqlmodel import Session, select
+from app.models import Organization, OrgAllowedSchema
+from app.core.config import settings
 from app.core.security import decrypt_str
 from app.dtos import OrgContext
+from app.utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# org_id → OrgContext; evita recarregar org + conexão + schemas + documentos a cada pergunta
+_ORG_CONTEXT_CACHE = TTLCache(
+    maxsize=settings.ORG_CONTEXT_CACHE_MAX_SIZE,
+    ttl=settings.ORG_CONTEXT_CACHE_TTL,
+)
+
+
+def invalidate_org_context_cache(org_id: str) -> None:
+    """
+    Drop the cached OrgContext of an organization.
+    Call after changes that affect it (connection, schemas, documents).
+    """
+    _ORG_CONTEXT_CACHE.pop(org_id)
+
+
+@lru_cache(maxsize=256)
+def _decrypt_connection_password(password_enc: str) -> str:
+    """
+    Decrypt a stored connection password, memoized by ciphertext
+
+    Updating the connection produces a new ciphertext, so stale entries
+    are never hit and need no explicit invalidation.
+    """
+    return decrypt_str(password_enc)
+
 
 class OrgRepository:
     """Handles Organization data access"""
@@ -19,6 +48,18 @@ class OrgRepository:
     def __init__(self, session: Session):
         self.session = session
 
+    def get_org_context_cached(self, org_id: str) -> OrgContext:
+        """
+        Same as get_org_context, served from a per-process TTL cache
+
+        Errors (org missing, no connection/schemas) are not cached.
+        """
+        org_ctx = _ORG_CONTEXT_CACHE.get(org_id)
+        if org_ctx is None:
+            org_ctx = self.get_org_context(org_id)
+            _ORG_CONTEXT_CACHE.set(org_id, org_ctx)
+        return org_ctx
+
     def get_org_context(self, org_id: str) -> OrgContext:
         """
         Load full organization context for query execution
@@ -26,8 +67,18 @@ class OrgRepository:
         Raises:
             HTTPException: If org not found or missing connection
         """
-        # Load organization
-        org = self.session.get(Organization, org_id)
+        # Load organization with connection + schemas + documents in one go;
+        # raiseload makes any other relationship access fail instead of lazy-loading
+        org = self.session.exec(
+            select(Organization)
+            .options(
+                joinedload(Organization.connection),
+                selectinload(Organization.allowed_schemas),
+                selectinload(Organization.documents),
+                raiseload("*")
+            )
+            .where(Organization.id == org_id)
+        ).first()
         if not org:
             raise HTTPException(
                 status_code=404,
@@ -53,7 +104,7 @@ class OrgRepository:
         biz_context = self._collect_biz_context(org)
 
         # Decrypt password
-        pwd = decrypt_str(org.connection.password_enc)
+        pwd = _decrypt_connection_password(org.connection.password_enc)
 
         # Build OrgContext DTO
         return OrgContext(
@@ -95,9 +146,11 @@ class OrgRepository:
         Returns:
             True if allowed, False otherwise
         """
-        org = self.session.get(Organization, org_id)
-        if not org:
-            return False
-
-        allowed = [x.schema_name for x in org.allowed_schemas]
-        return schema_name in allowed
+        return self.session.exec(
+            select(
+                select(OrgAllowedSchema.schema_name).where(
+                    OrgAllowedSchema.org_id == org_id,
+                    OrgAllowedSchema.schema_name == schema_name
+                ).exists()
+            )
+        ).one()
@@ -60,7 +60,6 @@ class QueryHistoryRepository:
 
             self.session.add(history)
             self.session.commit()
-            self.session.refresh(history)
 
             logger.info(f"Saved query history {history.id} for user {user_id}")
 
@@ -21,6 +21,7 @@ class ListConversationsResponse(BaseModel):
     """Response for listing conversations"""
     conversations: List[ConversationResponse]
     total: int
+    next_cursor: Optional[str] = None  # Pass as ?cursor= to fetch the next page
 
 
 class MessageResponse(BaseModel):
@@ -2,14 +2,14 @@
 Schemas for member management endpoints
 """
 from pydantic import BaseModel, EmailStr, Field
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 
 class InviteMemberRequest(BaseModel):
     """Request body for POST /members/invite"""
     email: EmailStr = Field(..., description="Email do membro a ser convidado")
     name: str = Field(..., min_length=1, max_length=120, description="Nome do membro")
-    role_in_org: Optional[str] = Field(default="member", description="Role: 'admin' ou 'member' (default: 'member')")
+    role_in_org: Optional[Literal["admin", "member"]] = Field(default="member", description="Role: 'admin' ou 'member' (default: 'member')")
 
 
 class InviteMemberResponse(BaseModel):
@@ -41,7 +41,7 @@ class ListMembersResponse(BaseModel):
 
 class UpdateMemberRoleRequest(BaseModel):
     """Request body for PUT /members/{user_id}"""
-    role_in_org: str = Field(..., description="Nova role: 'org_admin' ou 'member'")
+    role_in_org: Literal["admin", "member"] = Field(..., description="Nova role: 'admin' ou 'member'")
 
 
 class UpdateMemberRoleResponse(BaseModel):
@@ -6,5 +6,6 @@ class AuthedUser(BaseModel):
     id: str
     email: str
     org_id: Optional[str] = None
+    role_in_org: Optional[str] = None
 
 
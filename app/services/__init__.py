@@ -1,10 +1,12 @@
 """
 Service layer for business logic
 """
-from app.services.enrichment_service import EnrichmentService
-from app.services.query_service import QueryService
+from app.services.enrichment_service import EnrichmentService, get_enrichment_service
+from app.services.query_service import QueryService, get_query_service
 
 __all__ = [
     "EnrichmentService",
     "QueryService",
+    "get_enrichment_service",
+    "get_query_service",
 ]
@@ -2,14 +2,23 @@
 Chart Generation Service using LLM
 Generates D3.js visualizations from query results
 """
+import asyncio
 import json
 import logging
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
-from app.pipeline.llm.client import call_llm
+from app.core.config import settings
+from app.core.security import cache_key_hex
+from app.pipeline.llm.client import call_llm, call_llm_async
 from app.pipeline.llm.parsers import parse_json
+from app.utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Single-flight for async chart generation: identical requests share one LLM call
+_CHART_INFLIGHT: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+_CHART_CACHE = TTLCache(maxsize=settings.CHART_CACHE_MAX_SIZE, ttl=settings.CHART_CACHE_TTL)
+
 
 class ChartService:
     """
@@ -54,7 +63,71 @@ class ChartService:
         # Call LLM
         response = call_llm(messages, temperature=0.3, max_tokens=2000)
 
-        # Parse response
+        return self._parse_chart_config(response, columns, data)
+
+    async def agenerate_chart_config(
+        self,
+        columns: List[str],
+        data: List[List[Any]],
+        question: str,
+        chart_hint: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Async version of generate_chart_config (doesn't block the event loop)
+
+        Identical requests (same columns, data, question and hint) are
+        coalesced: concurrent ones await the same in-flight LLM call and
+        later ones hit a short-lived result cache.
+        """
+        key = cache_key_hex(json.dumps([columns, data, question, chart_hint], default=str))
+
+        cached = _CHART_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        task = _CHART_INFLIGHT.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._agenerate_uncached(key, columns, data, question, chart_hint)
+            )
+            _CHART_INFLIGHT[key] = task
+            task.add_done_callback(lambda _: _CHART_INFLIGHT.pop(key, None))
+
+        # shield: one client disconnecting must not cancel the call for the others
+        return await asyncio.shield(task)
+
+    async def _agenerate_uncached(
+        self,
+        key: str,
+        columns: List[str],
+        data: List[List[Any]],
+        question: str,
+        chart_hint: Optional[str]
+    ) -> Dict[str, Any]:
+        """Run the LLM call for a chart and store the result in the cache"""
+        logger.info(f"Generating chart for question: '{question[:50]}...'")
+
+        messages = self._build_chart_prompt(columns, data, question, chart_hint)
+        response = await call_llm_async(messages, temperature=0.3, max_tokens=2000)
+
+        try:
+            config = parse_json(response)
+        except Exception as e:
+            logger.error(f"Failed to parse chart config: {e}")
+            # Fallback não vai para o cache: a próxima chamada tenta o LLM de novo
+            return self._create_fallback_chart(columns, data)
+
+        logger.info(f"Generated chart type: {config.get('type')}")
+        _CHART_CACHE.set(key, config)
+        return config
+
+    def _parse_chart_config(
+        self,
+        response: str,
+        columns: List[str],
+        data: List[List[Any]]
+    ) -> Dict[str, Any]:
+        """Parse LLM chart response, falling back to a simple chart"""
         try:
             chart_config = parse_json(response)
             logger.info(f"Generated chart type: {chart_config.get('type')}")
@@ -85,7 +158,35 @@ class ChartService:
         """
         logger.info(f"Regenerating chart with instruction: '{edit_instruction}'")
 
-        messages = [
+        messages = self._build_regenerate_prompt(current_config, columns, data, edit_instruction)
+        response = call_llm(messages, temperature=0.3, max_tokens=2000)
+
+        return self._parse_regenerated_config(response, current_config)
+
+    async def aregenerate_chart(
+        self,
+        current_config: Dict[str, Any],
+        columns: List[str],
+        data: List[List[Any]],
+        edit_instruction: str
+    ) -> Dict[str, Any]:
+        """Async version of regenerate_chart (doesn't block the event loop)"""
+        logger.info(f"Regenerating chart with instruction: '{edit_instruction}'")
+
+        messages = self._build_regenerate_prompt(current_config, columns, data, edit_instruction)
+        response = await call_llm_async(messages, temperature=0.3, max_tokens=2000)
+
+        return self._parse_regenerated_config(response, current_config)
+
+    def _build_regenerate_prompt(
+        self,
+        current_config: Dict[str, Any],
+        columns: List[str],
+        data: List[List[Any]],
+        edit_instruction: str
+    ) -> List[Dict[str, str]]:
+        """Build prompt for chart regeneration"""
+        return [
             {
                 "role": "system",
                 "content": "You are a data visualization expert. Modify charts based on user instructions."
@@ -107,8 +208,12 @@ Preserve what works, only change what the user requested.
             }
         ]
 
-        response = call_llm(messages, temperature=0.3, max_tokens=2000)
-
+    def _parse_regenerated_config(
+        self,
+        response: str,
+        current_config: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Parse LLM regenerate response, keeping the current config on failure"""
         try:
             updated_config = parse_json(response)
             logger.info(f"Chart regenerated successfully")
@@ -220,3 +325,9 @@ Generate the best chart configuration for this data.
                 "showGrid": True
             }
         }
+
+
+@lru_cache(maxsize=1)
+def get_chart_service() -> ChartService:
+    """Process-wide ChartService (stateless, safe to share across requests/threads)"""
+    return ChartService()
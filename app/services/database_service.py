@@ -2,15 +2,37 @@
 Serviço para operações de descoberta e teste de conexões com banco de dados.
 """
 
+from contextlib import contextmanager
 from sqlalchemy import create_engine, text, inspect
-from sqlalchemy.engine import Connection
-from typing import List, Dict, Any
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.pool import NullPool
+from typing import Iterator, List, Dict, Any
 from fastapi import HTTPException
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@contextmanager
+def _ad_hoc_engine(url: str) -> Iterator[Engine]:
+    """
+    Engine descartável para conexões pontuais (teste/descoberta).
+
+    NullPool: a conexão é fechada ao sair do bloco, em vez de ficar
+    ociosa num QueuePool até o GC coletar a engine.
+    """
+    engine = create_engine(
+        url,
+        poolclass=NullPool,
+        future=True,
+        connect_args={"connect_timeout": 5}
+    )
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
 class DatabaseService:
     """Service para testar conexões e listar databases/schemas"""
 
@@ -45,9 +67,7 @@ class DatabaseService:
             url = f"{driver}://{username}:{password}@{host}:{port}/{database_name}"
 
             # Tenta criar engine e conectar
-            engine = create_engine(url, pool_pre_ping=True)
-
-            with engine.connect() as conn:
+            with _ad_hoc_engine(url) as engine, engine.connect() as conn:
                 # Executa query simples para validar conexão
                 result = conn.execute(text("SELECT 1 as test"))
                 result.fetchone()
@@ -112,9 +132,7 @@ class DatabaseService:
         try:
             # Conecta ao database 'mysql' (sempre existe)
             url = f"{driver}://{username}:{password}@{host}:{port}/mysql"
-            engine = create_engine(url, pool_pre_ping=True)
-
-            with engine.connect() as conn:
+            with _ad_hoc_engine(url) as engine, engine.connect() as conn:
                 # Executa SHOW DATABASES
                 result = conn.execute(text("SHOW DATABASES"))
                 databases = [row[0] for row in result]
@@ -164,11 +182,9 @@ class DatabaseService:
         try:
             # Conecta ao database específico
             url = f"{driver}://{username}:{password}@{host}:{port}/{database_name}"
-            engine = create_engine(url, pool_pre_ping=True)
-
             # Usa inspector do SQLAlchemy para listar tabelas
-            inspector = inspect(engine)
-            tables = inspector.get_table_names()
+            with _ad_hoc_engine(url) as engine:
+                tables = inspect(engine).get_table_names()
 
             logger.info(f"Listadas {len(tables)} tabelas no database '{database_name}'")
 
@@ -209,10 +225,8 @@ class DatabaseService:
         """
         try:
             url = f"{driver}://{username}:{password}@{host}:{port}/{database_name}"
-            engine = create_engine(url, pool_pre_ping=True)
-
-            inspector = inspect(engine)
-            columns = inspector.get_columns(table_name)
+            with _ad_hoc_engine(url) as engine:
+                columns = inspect(engine).get_columns(table_name)
 
             # Formata informações das colunas
             column_info = []
@@ -2,13 +2,22 @@
 Service for query result enrichment
 Generates insights and charts from SQL results
 """
+import json
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional
+from app.core.config import settings
+from app.core.security import cache_key_hex
 from app.dtos import QueryExecutionContext, OrgContext
 from app.pipeline.stages import generate_insights, generate_chart, QueryResult
+from app.utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Insights: (question, columns, rows, business context) → text
+# Chave inclui os dados: só reaproveita quando o resultado é idêntico
+_INSIGHTS_CACHE = TTLCache(maxsize=settings.INSIGHTS_CACHE_MAX_SIZE, ttl=settings.INSIGHTS_CACHE_TTL)
+
 
 class EnrichmentService:
     """
@@ -19,7 +28,8 @@ class EnrichmentService:
     def enrich_results(
         self,
         ctx: QueryExecutionContext,
-        org_ctx: OrgContext
+        org_ctx: OrgContext,
+        token_callback: Optional[Callable[[str], None]] = None
     ) -> None:
         """
         Enrich query results with insights and chart
@@ -31,6 +41,7 @@ class EnrichmentService:
         Args:
             ctx: Query execution context with results
             org_ctx: Organization context for business context
+            token_callback: Receives insights text as the LLM streams it
         """
         if not ctx.colunas or not ctx.dados:
             logger.debug("Skipping enrichment: no data to enrich")
@@ -38,7 +49,7 @@ class EnrichmentService:
 
         # Generate insights
         try:
-            ctx.insights_text = self._generate_insights(ctx, org_ctx)
+            ctx.insights_text = self._generate_insights(ctx, org_ctx, token_callback)
             logger.info("Insights generated successfully")
         except Exception as e:
             logger.warning(f"Failed to generate insights: {e}")
@@ -58,19 +69,35 @@ class EnrichmentService:
     def _generate_insights(
         self,
         ctx: QueryExecutionContext,
-        org_ctx: OrgContext
+        org_ctx: OrgContext,
+        token_callback: Optional[Callable[[str], None]] = None
     ) -> str:
         """
         Generate business insights from query results
 
         Uses LLM to analyze data and provide actionable insights
+        (cached for identical question + result + business context)
         """
-        return generate_insights(
+        key = cache_key_hex(json.dumps(
+            [" ".join(ctx.pergunta.lower().split()), ctx.colunas, ctx.dados, org_ctx.biz_context],
+            default=str
+        ))
+        cached = _INSIGHTS_CACHE.get(key)
+        if cached is not None:
+            if token_callback:
+                token_callback(cached)
+            return cached
+
+        insights = generate_insights(
             pergunta=ctx.pergunta,
             colunas=ctx.colunas,
             dados=ctx.dados,
-            biz_context=org_ctx.biz_context
+            biz_context=org_ctx.biz_context,
+            token_callback=token_callback
         )
+        if insights:
+            _INSIGHTS_CACHE.set(key, insights)
+        return insights
 
     def _generate_chart(
         self,
@@ -94,3 +121,9 @@ class EnrichmentService:
         )
 
         return generate_chart(query_result)
+
+
+@lru_cache(maxsize=1)
+def get_enrichment_service() -> EnrichmentService:
+    """Process-wide EnrichmentService (stateless, safe to share across requests/threads)"""
+    return EnrichmentService()
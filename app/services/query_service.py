@@ -4,11 +4,18 @@ Encapsulates the full query execution pipeline
 """
 import time
 import logging
-from typing import Optional, Dict, Any, Tuple, Callable
+import threading
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, Any, Tuple, Callable, NamedTuple
 from datetime import datetime
-from fastapi import HTTPException
-from sqlalchemy import create_engine
+from fastapi import BackgroundTasks, Depends, HTTPException
 from sqlalchemy.engine import Connection
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.security import cache_key_hex
 
 from app.dtos import (
     OrgContext,
@@ -19,8 +26,11 @@ from app.dtos import (
 from app.repositories.clarification_repository import ClarificationRepository
 from app.repositories.audit_repository import AuditRepository
 from app.repositories.conversation_repository import ConversationRepository
-from app.services.enrichment_service import EnrichmentService
-from app.services.chart_service import ChartService
+from app.repositories.query_history_repository import QueryHistoryRepository
+from app.services.enrichment_service import EnrichmentService, get_enrichment_service
+from app.services.chart_service import get_chart_service
+from app.utils.cache import TTLCache
+from app.utils.database import get_engine
 from app.pipeline.stages import (
     analyze_intent,
     generate_sql,
@@ -29,16 +39,94 @@ from app.pipeline.stages import (
     pick_schema,
 )
 from app.pipeline.sql import (
-    catalog_for_current_db,
-    esquema_resumido,
+    get_catalog_for_org,
     get_schema_index_for_org,
     rank_schemas_by_overlap,
     proteger_sql_singledb,
     executar_sql_readonly_on_conn,
+    reparar_coluna_desconhecida,
 )
 
 logger = logging.getLogger(__name__)
 
+# LLM schema picks: (org_id, allowed schemas, question hash) → schema
+_SCHEMA_PICK_CACHE = TTLCache(
+    maxsize=settings.SCHEMA_PICK_CACHE_MAX_SIZE,
+    ttl=settings.SCHEMA_PICK_CACHE_TTL
+)
+
+# Intent + SQL that already executed successfully: (org, schema, catalog, limit, question) → (intent, sql)
+# (clarified questions use the same key + "clarified" and store no intent)
+# Só o trabalho de LLM é reaproveitado; os dados são sempre consultados de novo
+_SQL_PLAN_CACHE = TTLCache(
+    maxsize=settings.SQL_PLAN_CACHE_MAX_SIZE,
+    ttl=settings.SQL_PLAN_CACHE_TTL
+)
+
+# Schemas where a question failed with unknown tables: (org_id, schema, question hash) → error detail
+_SCHEMA_MISS_CACHE = TTLCache(
+    maxsize=settings.SCHEMA_MISS_CACHE_MAX_SIZE,
+    ttl=settings.SCHEMA_MISS_CACHE_TTL
+)
+
+
+class _SchemaAttempt(NamedTuple):
+    """Catalog, intent and generated SQL for one schema attempt"""
+    catalog: Dict[str, Any]
+    esquema_txt: str
+    intent: Any
+    sql: Optional[str]
+
+
+def _insight_token_callback(
+    event_callback: Optional[Callable[[StreamEvent], None]]
+) -> Optional[Callable[[str], None]]:
+    """Forward streamed insights text as `insight_token` events (None when not streaming)"""
+    if event_callback is None:
+        return None
+
+    def on_token(token: str) -> None:
+        event_callback(StreamEvent(stage="insight_token", progress=85, message=token))
+
+    return on_token
+
+
+def _is_schema_resolution_error(detail: str) -> bool:
+    """True when the SQL referenced tables that don't live in the schema tried"""
+    return "Tabela(s) não encontrada(s)" in detail or "multi-DB" in detail
+
+
+def _normalize_question(pergunta: str) -> str:
+    """Lowercase and collapse whitespace so trivially different questions share a key"""
+    return " ".join(pergunta.lower().split())
+
+
+@lru_cache(maxsize=256)
+def _esquema_hash(esquema_txt: str) -> str:
+    """
+    Digest of a catalog text, computed once per cached catalog
+
+    The text comes from the catalog cache, so repeat calls pass the same str
+    object (hash already cached by Python) and hit this memo without re-hashing.
+    """
+    return cache_key_hex(esquema_txt)
+
+
+def _sql_plan_key(
+    org_id: str,
+    schema: str,
+    esquema_txt: str,
+    ctx: QueryExecutionContext
+) -> Tuple[str, str, str, int, str]:
+    """Cache key for _SQL_PLAN_CACHE (catalog text hashed so schema changes miss)"""
+    return (
+        org_id,
+        schema,
+        _esquema_hash(esquema_txt),
+        ctx.max_linhas,
+        cache_key_hex(_normalize_question(ctx.pergunta))
+    )
+
 
 class QueryService:
     """
@@ -52,13 +140,15 @@ class QueryService:
         audit_repo: AuditRepository,
         enrichment_service: EnrichmentService,
         conversation_repo: Optional[ConversationRepository] = None,
-        query_history_repo: Optional['QueryHistoryRepository'] = None
+        query_history_repo: Optional[QueryHistoryRepository] = None,
+        background_tasks: Optional[BackgroundTasks] = None
     ):
         self.clarification_repo = clarification_repo
         self.audit_repo = audit_repo
         self.enrichment_service = enrichment_service
         self.conversation_repo = conversation_repo
         self.query_history_repo = query_history_repo
+        self.background_tasks = background_tasks  # Defers audit writes past the response
 
     def execute_query(
         self,
@@ -163,36 +253,84 @@ class QueryService:
             ))
 
         # Select schema
-        schema_order = self._select_schema_order(ctx, org_ctx)
+        schema_order, confident, tied = self._select_schema_order(ctx, org_ctx)
 
         # Try executing on schemas in order
         last_error: Optional[str] = None
+        executor: Optional[ThreadPoolExecutor] = None
+        prepared: Dict[str, Future] = {}
+        # Set on return: fallback preparations still running stop before generating SQL
+        stop_fallbacks = threading.Event()
+
+        # Skip schemas where this same question recently failed with unknown tables,
+        # but always keep at least one candidate (the LLM may get it right this time)
+        question_key = cache_key_hex(_normalize_question(ctx.pergunta))
+        for schema in list(schema_order):
+            if len(schema_order) == 1:
+                break
+            miss = _SCHEMA_MISS_CACHE.get((org_ctx.org_id, schema, question_key))
+            if miss is not None:
+                schema_order.remove(schema)
+                last_error = f"[{schema}] {miss}"
 
-        for schema in schema_order:
-            try:
-                result = self._execute_on_schema(ctx, org_ctx, schema, event_callback)
-
-                # Success! Log audit and return
-                self.audit_repo.log_from_context(org_ctx.org_id, ctx)
-
-                # Emit completion event
-                if event_callback:
-                    event_callback(StreamEvent(
-                        stage="completed",
-                        progress=100,
-                        message="Consulta executada com sucesso"
-                    ))
-
-                return result
+        try:
+            # Empate real no overlap: prepara os outros empatados em paralelo com o preferido
+            speculative = [s for s in schema_order[1:] if s in tied][:settings.SCHEMA_FALLBACK_CONCURRENCY]
+            if speculative:
+                executor = ThreadPoolExecutor(max_workers=settings.SCHEMA_FALLBACK_CONCURRENCY)
+                prepared = {
+                    s: executor.submit(self._prepare_on_schema, ctx, org_ctx, s, None, stop_fallbacks)
+                    for s in speculative
+                }
 
-            except HTTPException as e:
-                last_error = f"[{schema}] {e.detail}"
-                logger.warning(f"Failed on schema {schema}: {e.detail}")
-                continue
-            except Exception as e:
-                last_error = f"[{schema}] {str(e)}"
-                logger.warning(f"Failed on schema {schema}: {e}")
-                continue
+            for schema in schema_order:
+                try:
+                    attempt = prepared[schema].result() if schema in prepared else None
+                    result = self._execute_on_schema(ctx, org_ctx, schema, event_callback, attempt)
+
+                    # Success! Log audit and return
+                    self.audit_repo.log_from_context(org_ctx.org_id, ctx, self.background_tasks)
+
+                    # Emit completion event
+                    if event_callback:
+                        event_callback(StreamEvent(
+                            stage="completed",
+                            progress=100,
+                            message="Consulta executada com sucesso"
+                        ))
+
+                    return result
+
+                except HTTPException as e:
+                    last_error = f"[{schema}] {e.detail}"
+                    logger.warning(f"Failed on schema {schema}: {e.detail}")
+                    schema_miss = _is_schema_resolution_error(str(e.detail))
+                    # Single-schema org: nothing else to try, so a miss is never remembered
+                    if schema_miss and len(org_ctx.allowed_schemas) > 1:
+                        _SCHEMA_MISS_CACHE.set((org_ctx.org_id, schema, question_key), e.detail)
+                except Exception as e:
+                    last_error = f"[{schema}] {str(e)}"
+                    logger.warning(f"Failed on schema {schema}: {e}")
+                    schema_miss = False
+
+                # Vencedor claro no overlap: só vale tentar outro schema se as tabelas não existem neste
+                if confident and not schema_miss:
+                    break
+
+                # Preferred schema failed: prepare the remaining fallbacks concurrently
+                if len(schema_order) > len(prepared) + 1:
+                    if executor is None:
+                        executor = ThreadPoolExecutor(max_workers=settings.SCHEMA_FALLBACK_CONCURRENCY)
+                    for s in schema_order[1:]:
+                        if s not in prepared:
+                            prepared[s] = executor.submit(
+                                self._prepare_on_schema, ctx, org_ctx, s, None, stop_fallbacks
+                            )
+        finally:
+            if executor is not None:
+                # Don't hold the response for fallbacks we no longer need
+                stop_fallbacks.set()
+                executor.shutdown(wait=False, cancel_futures=True)
 
         # All schemas failed
         raise HTTPException(
@@ -238,44 +376,46 @@ class QueryService:
         schema = session.schema_name
         ctx.schema_used = schema
 
-        # Connect and execute
+        # Get schema (cached; connects only on a miss)
         db_url = org_ctx.build_sqlalchemy_url(schema)
-        eng = create_engine(db_url, pool_pre_ping=True, future=True)
-
-        with eng.connect() as conn:
-            # Get schema
-            catalog = catalog_for_current_db(conn, db_name=schema)
-            esquema_txt = esquema_resumido(catalog)
+        catalog, esquema_txt = get_catalog_for_org(org_ctx.org_id, db_url, schema)
 
-            # Emit SQL generation event
-            if event_callback:
-                event_callback(StreamEvent(
-                    stage="generating_sql",
-                    progress=40,
-                    message="Gerando consulta SQL"
-                ))
+        # Emit SQL generation event
+        if event_callback:
+            event_callback(StreamEvent(
+                stage="generating_sql",
+                progress=40,
+                message="Gerando consulta SQL"
+            ))
 
-            # Generate SQL (skip intent analysis)
-            ctx.pergunta = clarified_question
+        # Generate SQL (skip intent analysis); same clarified question on this catalog reuses its SQL
+        ctx.pergunta = clarified_question
+        plan_key = _sql_plan_key(org_ctx.org_id, schema, esquema_txt, ctx) + ("clarified",)
+        cached = _SQL_PLAN_CACHE.get(plan_key)
+        if cached is not None:
+            _, sql = cached
+        else:
             sql = generate_sql(clarified_question, esquema_txt, ctx.max_linhas)
-            ctx.sql_generated = sql
+        ctx.sql_generated = sql
 
-            # Emit execution event
-            if event_callback:
-                event_callback(StreamEvent(
-                    stage="executing_sql",
-                    progress=60,
-                    message="Executando consulta no banco de dados",
-                    data={"sql": sql}
-                ))
+        # Emit execution event
+        if event_callback:
+            event_callback(StreamEvent(
+                stage="executing_sql",
+                progress=60,
+                message="Executando consulta no banco de dados",
+                data={"sql": sql}
+            ))
 
-            # Execute with retry
+        # Connect only for execution (no pooled connection held during the LLM call)
+        with get_engine(db_url).connect() as conn:
             self._execute_sql_with_retry(conn, sql, esquema_txt, catalog, schema, ctx)
+        _SQL_PLAN_CACHE.set(plan_key, (None, ctx.sql_executed))
 
         # Generate chart configuration if we have data
         if ctx.dados and len(ctx.dados) > 0:
             try:
-                chart_service = ChartService()
+                chart_service = get_chart_service()
                 chart_config = chart_service.generate_chart_config(
                     columns=ctx.colunas or [],
                     data=ctx.dados[:10],  # Send first 10 rows for efficiency
@@ -299,13 +439,13 @@ class QueryService:
                     message="Gerando insights e gráficos"
                 ))
 
-            self.enrichment_service.enrich_results(ctx, org_ctx)
+            self.enrichment_service.enrich_results(ctx, org_ctx, _insight_token_callback(event_callback))
 
         # Clean up session
         self.clarification_repo.delete_session(ctx.clarification_id)
 
         # Log audit
-        self.audit_repo.log_from_context(org_ctx.org_id, ctx)
+        self.audit_repo.log_from_context(org_ctx.org_id, ctx, self.background_tasks)
 
         # Emit completion event
         if event_callback:
@@ -318,16 +458,81 @@ class QueryService:
         # Build response
         return self._build_response(org_ctx.org_id, ctx)
 
+    def _prepare_on_schema(
+        self,
+        ctx: QueryExecutionContext,
+        org_ctx: OrgContext,
+        schema: str,
+        event_callback: Optional[Callable[[StreamEvent], None]] = None,
+        stop: Optional[threading.Event] = None
+    ) -> _SchemaAttempt:
+        """
+        Run the LLM-bound part of an attempt: catalog, intent analysis, SQL generation
+
+        Only reads ctx and touches no repository, so it can run for
+        several schemas concurrently. If `stop` is set after intent analysis
+        (another schema already answered), SQL generation is skipped.
+        """
+        # Get schema (cached; connects only on a miss)
+        db_url = org_ctx.build_sqlalchemy_url(schema)
+        catalog, esquema_txt = get_catalog_for_org(org_ctx.org_id, db_url, schema)
+
+        # Same question already answered on this catalog: skip intent analysis + SQL generation
+        cached = _SQL_PLAN_CACHE.get(_sql_plan_key(org_ctx.org_id, schema, esquema_txt, ctx))
+        if cached is not None:
+            intent, sql = cached
+            return _SchemaAttempt(catalog, esquema_txt, intent, sql)
+
+        # Emit intent analysis event
+        if event_callback:
+            event_callback(StreamEvent(
+                stage="analyzing_intent",
+                progress=20,
+                message="Analisando intenção da pergunta"
+            ))
+
+        # Analyze intent
+        intent = analyze_intent(
+            pergunta=ctx.pergunta,
+            esquema=esquema_txt,
+            confidence_threshold=0.5
+        )
+
+        if intent.schema_mismatch or not intent.is_clear:
+            return _SchemaAttempt(catalog, esquema_txt, intent, None)
+
+        # Fallback descartado: resposta já enviada, não paga a chamada de geração de SQL
+        if stop is not None and stop.is_set():
+            return _SchemaAttempt(catalog, esquema_txt, intent, None)
+
+        # Emit SQL generation event
+        if event_callback:
+            event_callback(StreamEvent(
+                stage="generating_sql",
+                progress=40,
+                message="Gerando consulta SQL"
+            ))
+
+        # Intent is clear, generate SQL
+        sql = generate_sql(ctx.pergunta, esquema_txt, ctx.max_linhas)
+
+        return _SchemaAttempt(catalog, esquema_txt, intent, sql)
+
     def _execute_on_schema(
         self,
         ctx: QueryExecutionContext,
         org_ctx: OrgContext,
         schema: str,
-        event_callback: Optional[Callable[[StreamEvent], None]] = None
+        event_callback: Optional[Callable[[StreamEvent], None]] = None,
+        attempt: Optional[_SchemaAttempt] = None
     ) -> Dict[str, Any]:
         """
         Try executing query on a specific schema
 
+        Args:
+            attempt: Already prepared catalog/intent/SQL for this schema
+                (prepared on the spot when None)
+
         Returns:
             Response dict if successful
         Raises:
@@ -335,74 +540,53 @@ class QueryService:
         """
         ctx.schema_used = schema
 
-        # Connect
-        db_url = org_ctx.build_sqlalchemy_url(schema)
-        eng = create_engine(db_url, pool_pre_ping=True, future=True)
-
-        with eng.connect() as conn:
-            # Get schema
-            catalog = catalog_for_current_db(conn, db_name=schema)
-            esquema_txt = esquema_resumido(catalog)
-
-            # Emit intent analysis event
-            if event_callback:
-                event_callback(StreamEvent(
-                    stage="analyzing_intent",
-                    progress=20,
-                    message="Analisando intenção da pergunta"
-                ))
-
-            # Analyze intent
-            intent = analyze_intent(
-                pergunta=ctx.pergunta,
-                esquema=esquema_txt,
-                confidence_threshold=0.5
-            )
-
-            # Check schema mismatch
-            if intent.schema_mismatch:
-                logger.warning(f"Schema mismatch: {intent.missing_data}")
-                return {
-                    "status": "schema_error",
-                    "message": "Desculpe, esses dados não estão disponíveis no sistema.",
-                    "missing_data": intent.missing_data,
-                    "suggestions": intent.questions[0]["options"] if intent.questions else [],
-                    "confidence": intent.confidence
-                }
+        if attempt is None:
+            attempt = self._prepare_on_schema(ctx, org_ctx, schema, event_callback)
+        intent = attempt.intent
+
+        # Check schema mismatch
+        if intent.schema_mismatch:
+            logger.warning(f"Schema mismatch: {intent.missing_data}")
+            return {
+                "status": "schema_error",
+                "message": "Desculpe, esses dados não estão disponíveis no sistema.",
+                "missing_data": intent.missing_data,
+                "suggestions": intent.questions[0]["options"] if intent.questions else [],
+                "confidence": intent.confidence
+            }
 
-            # Check if clarification needed
-            if not intent.is_clear:
-                logger.warning(f"Low confidence ({intent.confidence:.2f}), requesting clarification")
-                return self._request_clarification(intent, schema, ctx, org_ctx)
+        # Check if clarification needed
+        if not intent.is_clear:
+            logger.warning(f"Low confidence ({intent.confidence:.2f}), requesting clarification")
+            return self._request_clarification(intent, schema, ctx, org_ctx)
 
-            # Emit SQL generation event
-            if event_callback:
-                event_callback(StreamEvent(
-                    stage="generating_sql",
-                    progress=40,
-                    message="Gerando consulta SQL"
-                ))
-
-            # Intent is clear, generate SQL
-            sql = generate_sql(ctx.pergunta, esquema_txt, ctx.max_linhas)
-            ctx.sql_generated = sql
+        sql = attempt.sql
+        ctx.sql_generated = sql
 
-            # Emit execution event
-            if event_callback:
-                event_callback(StreamEvent(
-                    stage="executing_sql",
-                    progress=60,
-                    message="Executando consulta no banco de dados",
-                    data={"sql": sql}
-                ))
+        # Emit execution event
+        if event_callback:
+            event_callback(StreamEvent(
+                stage="executing_sql",
+                progress=60,
+                message="Executando consulta no banco de dados",
+                data={"sql": sql}
+            ))
 
-            # Execute with retry
-            self._execute_sql_with_retry(conn, sql, esquema_txt, catalog, schema, ctx)
+        # Execute with retry
+        db_url = org_ctx.build_sqlalchemy_url(schema)
+        with get_engine(db_url).connect() as conn:
+            self._execute_sql_with_retry(
+                conn, sql, attempt.esquema_txt, attempt.catalog, schema, ctx
+            )
+        _SQL_PLAN_CACHE.set(
+            _sql_plan_key(org_ctx.org_id, schema, attempt.esquema_txt, ctx),
+            (intent, ctx.sql_executed)
+        )
 
         # Generate chart configuration if we have data
         if ctx.dados and len(ctx.dados) > 0:
             try:
-                chart_service = ChartService()
+                chart_service = get_chart_service()
                 chart_config = chart_service.generate_chart_config(
                     columns=ctx.colunas or [],
                     data=ctx.dados[:10],  # Send first 10 rows for efficiency
@@ -426,7 +610,7 @@ class QueryService:
                     message="Gerando insights e gráficos"
                 ))
 
-            self.enrichment_service.enrich_results(ctx, org_ctx)
+            self.enrichment_service.enrich_results(ctx, org_ctx, _insight_token_callback(event_callback))
 
         # Build response
         return self._build_response(org_ctx.org_id, ctx)
@@ -449,8 +633,7 @@ class QueryService:
         try:
             sql_seguro = proteger_sql_singledb(sql, catalog, db_name=schema, max_linhas=ctx.max_linhas)
         except HTTPException as e:
-            msg = str(e.detail)
-            if "Tabela(s) não encontrada(s)" in msg or "multi-DB" in msg:
+            if _is_schema_resolution_error(str(e.detail)):
                 raise  # Let caller try next schema
             raise
 
@@ -460,24 +643,39 @@ class QueryService:
         try:
             resultado = executar_sql_readonly_on_conn(conn, sql_seguro)
         except Exception as err:
-            # Retry with correction
-            logger.warning(f"SQL error, attempting correction: {err}")
-            sql2 = correct_sql(
-                sql_original=sql_seguro,
-                erro=str(err),
-                esquema=esquema_txt,
-                limit=ctx.max_linhas
-            )
-            sql_seguro = proteger_sql_singledb(sql2, catalog, db_name=schema, max_linhas=ctx.max_linhas)
-            resultado = executar_sql_readonly_on_conn(conn, sql_seguro)
+            resultado = None
+
+            # Coluna com nome errado: corrige contra o catálogo sem chamar o LLM
+            sql_reparado = reparar_coluna_desconhecida(sql_seguro, str(err), catalog)
+            if sql_reparado:
+                logger.warning(f"SQL error, trying catalog column fix: {err}")
+                try:
+                    sql_reparado = proteger_sql_singledb(
+                        sql_reparado, catalog, db_name=schema, max_linhas=ctx.max_linhas
+                    )
+                    resultado = executar_sql_readonly_on_conn(conn, sql_reparado)
+                    sql_seguro = sql_reparado
+                except Exception as err2:
+                    err = err2
+
+            if resultado is None:
+                # Retry with correction
+                logger.warning(f"SQL error, attempting correction: {err}")
+                sql2 = correct_sql(
+                    sql_original=sql_seguro,
+                    erro=str(err),
+                    esquema=esquema_txt,
+                    limit=ctx.max_linhas
+                )
+                sql_seguro = proteger_sql_singledb(sql2, catalog, db_name=schema, max_linhas=ctx.max_linhas)
+                resultado = executar_sql_readonly_on_conn(conn, sql_seguro)
 
         ctx.duration_ms = int((time.time() - t0) * 1000)
         ctx.sql_executed = sql_seguro
 
         # Parse results
         ctx.colunas = resultado.get("colunas", [])
-        dados_dict = resultado.get("dados", [])
-        ctx.dados = [[row.get(col) for col in ctx.colunas] for row in dados_dict]
+        ctx.dados = resultado.get("dados", [])
         ctx.row_count = len(ctx.dados)
 
         logger.info(f"SQL executed: {sql_seguro}")
@@ -525,12 +723,23 @@ class QueryService:
         self,
         ctx: QueryExecutionContext,
         org_ctx: OrgContext
-    ) -> list[str]:
+    ) -> Tuple[list[str], bool, list[str]]:
         """
         Select order to try schemas
 
-        Uses overlap ranking + LLM tie-breaking
+        Uses overlap ranking + LLM tie-breaking. The LLM is only consulted
+        when there is no unique overlap winner (and SCHEMA_PICK_USE_LLM is on),
+        and only among the tied schemas when any schema overlaps.
+
+        Returns (order, confident, tied): confident means a unique overlap
+        winner scored at least SCHEMA_CONFIDENT_OVERLAP, so the remaining
+        schemas are only worth trying on schema-resolution errors; tied lists
+        the schemas sharing a positive top score (empty when there is no tie).
         """
+        # Nothing to rank
+        if len(org_ctx.allowed_schemas) == 1:
+            return list(org_ctx.allowed_schemas), True, []
+
         # Build schema index
         base_url = org_ctx.build_sqlalchemy_url(org_ctx.database_name)
         schema_index = get_schema_index_for_org(
@@ -544,15 +753,28 @@ class QueryService:
         best_by_overlap, top_score = ranked[0]
         top_ties = [s for s, sc in ranked if sc == top_score]
 
-        # Use LLM to pick if ambiguous
-        if top_score == 0 or len(top_ties) > 1:
-            picked = pick_schema(org_ctx.allowed_schemas, ctx.pergunta)
-            preferred = picked or best_by_overlap
+        # Use LLM to pick if ambiguous (memoized per org + candidates + normalized question)
+        if settings.SCHEMA_PICK_USE_LLM and (top_score == 0 or len(top_ties) > 1):
+            candidates = top_ties if top_score > 0 else list(org_ctx.allowed_schemas)
+            cache_key = (
+                org_ctx.org_id,
+                tuple(candidates),
+                cache_key_hex(_normalize_question(ctx.pergunta))
+            )
+            picked = _SCHEMA_PICK_CACHE.get(cache_key)
+            if picked is None:
+                picked = pick_schema(candidates, ctx.pergunta)
+                if picked:
+                    _SCHEMA_PICK_CACHE.set(cache_key, picked)
+            preferred = picked if picked in candidates else best_by_overlap
         else:
             preferred = best_by_overlap
 
-        # Return order: preferred first, then others
-        return [preferred] + [s for s in org_ctx.allowed_schemas if s != preferred]
+        confident = len(top_ties) == 1 and top_score >= settings.SCHEMA_CONFIDENT_OVERLAP
+        tied = top_ties if top_score > 0 and len(top_ties) > 1 else []
+
+        # Return order: preferred first, then others by overlap score
+        return [preferred] + [s for s, _ in ranked if s != preferred], confident, tied
 
     def _build_response(
         self,
@@ -705,3 +927,24 @@ class QueryService:
 
         except Exception as e:
             logger.error(f"Failed to save to query history: {e}", exc_info=True)
+
+
+def get_query_service(
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+) -> QueryService:
+    """
+    FastAPI dependency: QueryService with request-scoped repositories
+
+    Repositories share the request Session (get_db is cached per request);
+    the stateless EnrichmentService is reused across requests. Audit
+    writes are deferred to the request's background tasks.
+    """
+    return QueryService(
+        clarification_repo=ClarificationRepository(db),
+        audit_repo=AuditRepository(db),
+        enrichment_service=get_enrichment_service(),
+        conversation_repo=ConversationRepository(db),
+        query_history_repo=QueryHistoryRepository(db),
+        background_tasks=background_tasks
+    )
@@ -1,6 +1,8 @@
+from functools import lru_cache
 from typing import Optional, Dict
 from urllib.parse import urlencode, quote
-from sqlalchemy.engine import make_url
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
 from fastapi import HTTPException
 
 
@@ -45,3 +47,21 @@ def build_sqlalchemy_url(
     pwd_enc = quote(password_plain, safe="")
     qs = "?" + urlencode(options or {}) if options else ""
     return f"{driver}://{username}:{pwd_enc}@{host}:{port}/{database}{qs}"
+
+
+@lru_cache(maxsize=256)
+def get_engine(db_url: str) -> Engine:
+    """
+    Return a pooled engine for an org database URL, creating it on first use
+
+    Engines (and their connection pools) are reused across requests so
+    each query does not pay a fresh TCP handshake + MySQL auth.
+    """
+    return create_engine(
+        db_url,
+        pool_size=5,
+        max_overflow=10,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        future=True
+    )
@@ -1,8 +1,7 @@
 import re
 import json
 import httpx
-from typing import Dict, Any
-from io import BytesIO
+from typing import Dict, Any, Iterable
 from fastapi import UploadFile
 
 from app.core.config import settings
@@ -11,8 +10,14 @@ from app.core.config import settings
 def extract_text_from_upload(file: UploadFile) -> str:
     """
     Extract text content from uploaded file (txt, pdf, docx)
+
+    PDF and DOCX parsers read straight from the spooled upload file, so the
+    whole document is only loaded into memory for plain text (or fallback).
+    Pages/paragraphs stop being parsed once DOCUMENT_MAX_TEXT_CHARS is reached.
+    Blocking: call it via run_in_threadpool from async handlers.
     """
-    content = file.file.read()
+    stream = file.file
+    stream.seek(0)
     name = (file.filename or "").lower()
     ctype = (file.content_type or "").lower()
     text = ""
@@ -25,33 +30,44 @@ def extract_text_from_upload(file: UploadFile) -> str:
                 continue
         return ""
 
+    def read_all() -> str:
+        stream.seek(0)
+        return safe_decode(stream.read())
+
+    def join_bounded(parts: Iterable[str]) -> str:
+        # Consome o iterador só até atingir o limite (páginas restantes não são parseadas)
+        out, size = [], 0
+        for part in parts:
+            out.append(part)
+            size += len(part) + 1
+            if size >= settings.DOCUMENT_MAX_TEXT_CHARS:
+                break
+        return "\n".join(out)
+
     if name.endswith(".txt") or ctype.startswith("text/"):
-        text = safe_decode(content)
+        text = read_all()
 
     elif name.endswith(".pdf") or "pdf" in ctype:
         try:
             import PyPDF2
-            reader = PyPDF2.PdfReader(BytesIO(content))
-            pages = []
-            for p in reader.pages:
-                pages.append(p.extract_text() or "")
-            text = "\n".join(pages)
+            reader = PyPDF2.PdfReader(stream)
+            text = join_bounded(p.extract_text() or "" for p in reader.pages)
         except Exception:
-            text = safe_decode(content)
+            text = read_all()
 
     elif name.endswith(".docx") or "officedocument.wordprocessingml.document" in ctype:
         try:
             import docx
-            doc = docx.Document(BytesIO(content))
-            text = "\n".join(p.text for p in doc.paragraphs)
+            doc = docx.Document(stream)
+            text = join_bounded(p.text for p in doc.paragraphs)
         except Exception:
-            text = safe_decode(content)
+            text = read_all()
 
     else:
         # Fallback to raw text
-        text = safe_decode(content)
+        text = read_all()
 
-    return (text or "").strip()
+    return (text or "")[:settings.DOCUMENT_MAX_TEXT_CHARS].strip()
 
 
 def summarize_business_metadata(raw_text: str) -> Dict[str, Any]:
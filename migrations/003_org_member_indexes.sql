@@ -0,0 +1,27 @@
+-- Migration: Index org_members by organization
+-- Date: 2026-10-15
+-- Description: A PK (user_id, org_id) só atende buscas por usuário. Listagem de membros,
+--              checagem de admin e contagem do último admin filtram por org_id (+ role_in_org).
+--              users.email, users.api_key_sha e orgs.name já possuem índices UNIQUE.
+
+-- ========================================
+-- STEP 1: Composite index for org lookups
+-- ========================================
+
+CREATE INDEX idx_org_members_org_role ON org_members(org_id, role_in_org);
+
+-- ========================================
+-- VERIFICATION QUERIES
+-- ========================================
+
+-- After running migration, verify with:
+-- SHOW INDEX FROM org_members;  -- Should list idx_org_members_org_role
+-- EXPLAIN SELECT COUNT(*) FROM org_members WHERE org_id = 'x' AND role_in_org = 'admin';
+
+-- ========================================
+-- ROLLBACK SCRIPT (in case of issues)
+-- ========================================
+
+/*
+DROP INDEX idx_org_members_org_role ON org_members;
+*/
@@ -0,0 +1,27 @@
+-- Migration: Index conversations for keyset pagination
+-- Date: 2026-10-15
+-- Description: GET /conversations pagina por cursor (updated_at, id) dentro de (user_id, org_id).
+--              O índice cobre o filtro e a ordenação, evitando filesort e OFFSET.
+
+-- ========================================
+-- STEP 1: Composite index for conversation listing
+-- ========================================
+
+CREATE INDEX idx_conversations_user_org_updated ON conversations(user_id, org_id, updated_at, id);
+
+-- ========================================
+-- VERIFICATION QUERIES
+-- ========================================
+
+-- After running migration, verify with:
+-- SHOW INDEX FROM conversations;  -- Should list idx_conversations_user_org_updated
+-- EXPLAIN SELECT * FROM conversations WHERE user_id = 'x' AND org_id = 'y'
+--   ORDER BY updated_at DESC, id DESC LIMIT 50;
+
+-- ========================================
+-- ROLLBACK SCRIPT (in case of issues)
+-- ========================================
+
+/*
+DROP INDEX idx_conversations_user_org_updated ON conversations;
+*/
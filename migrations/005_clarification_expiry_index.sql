@@ -0,0 +1,28 @@
+-- Migration: Index clarification sessions by expiry
+-- Date: 2026-10-15
+-- Description: A limpeza de sessões de clarificação expiradas (DELETE ... WHERE expires_at < ?)
+--              roda após cada nova sessão; sem índice seria um full scan da tabela.
+--              MySQL não tem índice parcial, então o índice é sobre expires_at inteiro.
+--              query_audit não é lido pela aplicação (só INSERT), então não ganha índice.
+
+-- ========================================
+-- STEP 1: Index for the expiry sweep
+-- ========================================
+
+CREATE INDEX idx_clarification_sessions_expires ON clarification_sessions(expires_at);
+
+-- ========================================
+-- VERIFICATION QUERIES
+-- ========================================
+
+-- After running migration, verify with:
+-- SHOW INDEX FROM clarification_sessions;  -- Should list idx_clarification_sessions_expires
+-- EXPLAIN DELETE FROM clarification_sessions WHERE expires_at < NOW() - INTERVAL 30 MINUTE;
+
+-- ========================================
+-- ROLLBACK SCRIPT (in case of issues)
+-- ========================================
+
+/*
+DROP INDEX idx_clarification_sessions_expires ON clarification_sessions;
+*/
@@ -0,0 +1,6 @@
+import os
+
+from cryptography.fernet import Fernet
+
+# app.core.config validates FERNET_KEY at import time
+os.environ.setdefault("FERNET_KEY", Fernet.generate_key().decode())
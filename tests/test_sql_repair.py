@@ -0,0 +1,49 @@
+"""
+Deterministic SQL repair (reparar_coluna_desconhecida)
+"""
+from app.pipeline.sql.repair import reparar_coluna_desconhecida
+
+CATALOG = {
+    "tables": {
+        "customer": {"columns": [{"name": "first_name"}, {"name": "last_name"}, {"name": "email"}]},
+        "payment": {"columns": [{"name": "amount"}, {"name": "customer_id"}]},
+    }
+}
+
+
+def test_fixes_misspelled_qualified_column():
+    sql = "SELECT c.frist_name FROM customer c"
+    erro = "(1054, \"Unknown column 'c.frist_name' in 'field list'\")"
+    assert reparar_coluna_desconhecida(sql, erro, CATALOG) == "SELECT c.first_name FROM customer c"
+
+
+def test_leaves_string_literals_untouched():
+    sql = "SELECT frist_name FROM customer WHERE email = 'frist_name' OR last_name = \"it's frist_name\""
+    erro = "(1054, \"Unknown column 'frist_name' in 'field list'\")"
+    assert reparar_coluna_desconhecida(sql, erro, CATALOG) == (
+        "SELECT first_name FROM customer WHERE email = 'frist_name' OR last_name = \"it's frist_name\""
+    )
+
+
+def test_qualified_reference_inside_literal_is_not_rewritten():
+    sql = "SELECT c.frist_name FROM customer c WHERE c.email = 'c.frist_name'"
+    erro = "(1054, \"Unknown column 'c.frist_name' in 'field list'\")"
+    assert reparar_coluna_desconhecida(sql, erro, CATALOG) == (
+        "SELECT c.first_name FROM customer c WHERE c.email = 'c.frist_name'"
+    )
+
+
+def test_only_in_literal_returns_none():
+    sql = "SELECT email FROM customer WHERE email = 'frist_name'"
+    erro = "(1054, \"Unknown column 'frist_name' in 'where clause'\")"
+    assert reparar_coluna_desconhecida(sql, erro, CATALOG) is None
+
+
+def test_column_from_another_table_returns_none():
+    sql = "SELECT c.amount FROM customer c JOIN payment p ON p.customer_id = c.id"
+    erro = "(1054, \"Unknown column 'c.amount' in 'field list'\")"
+    assert reparar_coluna_desconhecida(sql, erro, CATALOG) is None
+
+
+def test_other_errors_return_none():
+    assert reparar_coluna_desconhecida("SELECT 1", "(1146, \"Table 'x' doesn't exist\")", CATALOG) is None